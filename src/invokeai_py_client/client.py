@@ -9,11 +9,10 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 from types import TracebackType
-from typing import Any, AsyncGenerator
+from typing import TYPE_CHECKING, Any, AsyncGenerator
 from urllib.parse import urlparse
 
 import requests
-import socketio  # type: ignore[import-untyped]
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -30,6 +29,11 @@ from invokeai_py_client.workflow import (
 )
 from invokeai_py_client.queue import QueueRepository
 
+if TYPE_CHECKING:
+    # socketio pulls in aiohttp/engineio (~100ms); it is only needed once an
+    # async event stream is opened, see ``connect_socketio``.
+    import socketio  # type: ignore[import-untyped]
+
 
 class InvokeAIClient:
     """
@@ -456,6 +460,8 @@ class InvokeAIClient:
             If connection fails.
         """
         if self._sio is None:
+            import socketio
+
             self._sio = socketio.AsyncClient()
         
         if not self._sio_connected:
@@ -6,7 +6,7 @@ Provides refresh, status helpers, cancel, and wait-for-completion.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 from typing import Any, TYPE_CHECKING
 
 import requests
@@ -25,6 +25,11 @@ from invokeai_py_client.dnn_model.dnn_model_exceptions import (
 if TYPE_CHECKING:  # pragma: no cover
     from invokeai_py_client.client import InvokeAIClient
 
+# Install job states after which polling can stop
+_TERMINAL_STATUSES: frozenset[InstallJobStatus] = frozenset(
+    {InstallJobStatus.COMPLETED, InstallJobStatus.ERROR, InstallJobStatus.CANCELLED}
+)
+
 
 class ModelInstJobHandle:
     """
@@ -84,7 +89,7 @@ class ModelInstJobHandle:
 
     def is_done(self) -> bool:
         s = self.status()
-        return s in {InstallJobStatus.COMPLETED, InstallJobStatus.ERROR, InstallJobStatus.CANCELLED}
+        return s in _TERMINAL_STATUSES
 
     def is_failed(self) -> bool:
         return self.status() == InstallJobStatus.ERROR
@@ -114,16 +119,11 @@ class ModelInstJobHandle:
         When `timeout` is None, wait indefinitely.
         Raises ModelInstallJobFailed on failure/cancelled, ModelInstallTimeout on timeout.
         """
-        start = datetime.now()
-        deadline = None if timeout is None else (start + timedelta(seconds=timeout))
+        deadline = None if timeout is None else time.monotonic() + timeout
         last_info: ModelInstJobInfo | None = None
         while True:
             # If we already know the terminal state, short-circuit
-            if self._info is not None and self._info.status in {
-                InstallJobStatus.COMPLETED,
-                InstallJobStatus.ERROR,
-                InstallJobStatus.CANCELLED,
-            }:
+            if self._info is not None and self._info.status in _TERMINAL_STATUSES:
                 info = self._info
                 if info.status == InstallJobStatus.COMPLETED:
                     return info
@@ -132,16 +132,14 @@ class ModelInstJobHandle:
                 )
             info = self.refresh()
             last_info = info
-            if info.status in {InstallJobStatus.COMPLETED, InstallJobStatus.ERROR, InstallJobStatus.CANCELLED}:
+            if info.status in _TERMINAL_STATUSES:
                 if info.status == InstallJobStatus.COMPLETED:
                     return info
                 raise ModelInstallJobFailed(
                     f"install job {self.job_id} ended with status={info.status}", info=info
                 )
-            import time
-
             time.sleep(poll_interval)
-            if deadline is not None and datetime.now() >= deadline:
+            if deadline is not None and time.monotonic() >= deadline:
                 raise ModelInstallTimeout(
                     f"install job {self.job_id} timed out after {timeout}s", last_info=last_info, timeout=timeout
                 )
@@ -29,6 +29,12 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"  # Job was cancelled by user or system
 
 
+# States after which a job no longer changes
+_TERMINAL_JOB_STATUSES: frozenset[JobStatus] = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
 class ImageCategory(str, Enum):
     """
     InvokeAI image categorization system.
@@ -250,11 +256,7 @@ class IvkJob(BaseModel):
         bool
             True if completed, failed, or cancelled.
         """
-        return self.status in [
-            JobStatus.COMPLETED,
-            JobStatus.FAILED,
-            JobStatus.CANCELLED,
-        ]
+        return self.status in _TERMINAL_JOB_STATUSES
 
     def is_successful(self) -> bool:
         """
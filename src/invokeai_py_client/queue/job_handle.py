@@ -6,7 +6,7 @@ Provides refresh, status helpers, cancel, and wait-for-completion.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 from typing import Optional, TYPE_CHECKING
 
 import requests
@@ -16,6 +16,11 @@ from invokeai_py_client.queue.queue_models import QueueItem, QueueItemStatus
 if TYPE_CHECKING:  # pragma: no cover
     from invokeai_py_client.client import InvokeAIClient
 
+# Queue item states after which polling can stop
+_TERMINAL_STATUSES: frozenset[QueueItemStatus] = frozenset(
+    {QueueItemStatus.COMPLETED, QueueItemStatus.FAILED, QueueItemStatus.CANCELED}
+)
+
 
 class JobHandle:
     """
@@ -92,11 +97,7 @@ class JobHandle:
         return self.status() == QueueItemStatus.IN_PROGRESS
 
     def is_complete(self) -> bool:
-        return self.status() in {
-            QueueItemStatus.COMPLETED,
-            QueueItemStatus.FAILED,
-            QueueItemStatus.CANCELED,
-        }
+        return self.status() in _TERMINAL_STATUSES
 
     def is_successful(self) -> bool:
         return self.status() == QueueItemStatus.COMPLETED
@@ -126,17 +127,11 @@ class JobHandle:
         """
         Poll until the job reaches a terminal state or timeout is reached.
         """
-        deadline = datetime.now() + timedelta(seconds=timeout)
-        while datetime.now() < deadline:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             item = self.refresh()
-            if item.status in {
-                QueueItemStatus.COMPLETED,
-                QueueItemStatus.FAILED,
-                QueueItemStatus.CANCELED,
-            }:
+            if item.status in _TERMINAL_STATUSES:
                 return item
-            import time
-
             time.sleep(poll_interval)
         # One last refresh so caller gets final state as of timeout
         return self.refresh()
@@ -7,7 +7,7 @@ JobHandle instances for queue items.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 from typing import Any, Optional, TYPE_CHECKING
 
 import requests
@@ -211,12 +211,10 @@ class QueueHandle:
         bool
             True if idle; False if timeout elapsed.
         """
-        deadline = datetime.now() + timedelta(seconds=timeout)
-        while datetime.now() < deadline:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             if not self.is_busy():
                 return True
-            import time
-
             time.sleep(poll_interval)
         return False
 
@@ -83,6 +83,7 @@ from __future__ import annotations
 
 from typing import Any, Optional, Protocol, Callable, Union
 import os
+import sys
 import logging
 from copy import deepcopy
 import pluggy
@@ -155,6 +156,8 @@ class DetectionPredicate(Protocol):  # pragma: no cover - structural typing help
 
 _dynamic_detection_rules: list[DetectionRule] = []
 _dynamic_field_builders: dict[str, FieldBuilder] = {}
+# Bumped on every rule / builder / plugin (re)registration; see ``registry_version``
+_registry_version = 0
 
 class FieldBuilder(Protocol):  # pragma: no cover
     def __call__(self, value: Any, field_info: dict[str, Any]) -> IvkField[Any]: ...
@@ -186,12 +189,14 @@ def register_detection_rule(field_type: Union[str, FieldTypeProvider], predicate
     """
     if first:
         priority = 0
+    global _registry_version
     rule = DetectionRule(field_type, predicate, priority, name)
     _dynamic_detection_rules.append(rule)
+    _registry_version += 1
     # Keep rules sorted by priority
     _dynamic_detection_rules.sort(key=lambda r: r.priority)
     if FIELD_DEBUG:
-        logger.debug(f"Registered detection rule '{rule.name}' for type '{field_type}' (priority {priority})")
+        logger.debug("Registered detection rule '%s' for type '%s' (priority %s)", rule.name, field_type, priority)
 
 def register_field_builder(field_type: str, builder: FieldBuilder, *, override: bool = True) -> None:
     """Register a builder for a field type.
@@ -211,11 +216,13 @@ def register_field_builder(field_type: str, builder: FieldBuilder, *, override:
     in debug mode and triggers strict failure if ``INVOKEAI_STRICT_FIELDS`` is
     set.
     """
+    global _registry_version
     if not override and field_type in _dynamic_field_builders:
         return
     _dynamic_field_builders[field_type] = builder
+    _registry_version += 1
     if FIELD_DEBUG:
-        logger.debug(f"Registered field builder for type '{field_type}' (override={override})")
+        logger.debug("Registered field builder for type '%s' (override=%s)", field_type, override)
 
 
 class FieldPluginSpec:
@@ -265,78 +272,20 @@ class CoreFieldPlugin:
             Detected field type identifier or ``None`` if no rule matches.
         """
         if FIELD_DEBUG:
-            logger.debug(f"Detecting field type: node={node_type}, field={field_name}, info_keys={list(field_info.keys())}")
+            logger.debug("Detecting field type: node=%s, field=%s, info_keys=%s", node_type, field_name, list(field_info))
         for rule in _dynamic_detection_rules:
             try:
                 if rule.predicate(node_type, field_name, field_info):
                     resolved = rule.field_type(node_type, field_name, field_info) if rule.dynamic else rule.field_type  # type: ignore[arg-type]
                     if FIELD_DEBUG:
-                        logger.debug(f"Rule '{rule.name}' matched -> type '{resolved}' (dynamic={rule.dynamic})")
+                        logger.debug("Rule '%s' matched -> type '%s' (dynamic=%s)", rule.name, resolved, rule.dynamic)
                     return str(resolved)
             except Exception as e:  # pragma: no cover
                 if FIELD_DEBUG:
-                    logger.warning(f"Detection rule '{rule.name}' raised {e!r}; continuing")
+                    logger.warning("Detection rule '%s' raised %r; continuing", rule.name, e)
         if FIELD_DEBUG:
-            logger.debug(f"No detection rule matched field: node={node_type}, field={field_name}")
+            logger.debug("No detection rule matched field: node=%s, field=%s", node_type, field_name)
         return None
-    
-    def _has_integer_constraints(self, field_info: dict[str, Any]) -> bool:
-        """Return True if numeric constraints imply an integer domain.
-
-        Parameters
-        ----------
-        field_info : dict
-            Field metadata containing possible constraint keys.
-
-        Returns
-        -------
-        bool
-            ``True`` when constraints (``multiple_of=1`` or integer min/max)
-            strongly indicate an integer space.
-        """
-        # Check for multiple_of constraint
-        if "multiple_of" in field_info:
-            multiple = field_info["multiple_of"]
-            if isinstance(multiple, (int, float)) and multiple == 1:
-                return True
-        
-        # Check if min/max are integers
-        minimum = field_info.get("minimum")
-        maximum = field_info.get("maximum")
-        
-        if minimum is not None and maximum is not None:
-            if isinstance(minimum, int) and isinstance(maximum, int):
-                return True
-            # Check for integer-like float bounds
-            if isinstance(minimum, float) and isinstance(maximum, float):
-                if minimum.is_integer() and maximum.is_integer():
-                    return True
-        
-        return False
-
-    def _normalize_enum_choices(self, field_info: dict[str, Any]) -> list[Any]:
-        """Extract a normalized flat list of enum choice values.
-
-        Parameters
-        ----------
-        field_info : dict
-            Field metadata potentially containing ``options`` or ``ui_choices``.
-
-        Returns
-        -------
-        list
-            Ordered list of primitive choice values.
-        """
-        choices = field_info.get("options", []) or field_info.get("ui_choices", [])
-        if isinstance(choices, list):
-            norm: list[Any] = []
-            for c in choices:
-                if isinstance(c, dict) and "value" in c:
-                    norm.append(c["value"])
-                else:
-                    norm.append(c)
-            return norm
-        return list(choices) if choices else []
 
     @hookimpl
     def build_field(self, field_type: str, value: Any, field_info: dict[str, Any]) -> Optional[IvkField[Any]]:
@@ -360,14 +309,14 @@ class CoreFieldPlugin:
         if isinstance(value, (dict, list)):
             value = deepcopy(value)
         if FIELD_DEBUG:
-            logger.debug(f"Building field via registry: type={field_type}, value_type={type(value).__name__}")
+            logger.debug("Building field via registry: type=%s, value_type=%s", field_type, type(value).__name__)
         builder = _dynamic_field_builders.get(field_type)
         if builder is not None:
             try:
                 return builder(value, field_info)
             except Exception as e:  # pragma: no cover
                 if FIELD_DEBUG:
-                    logger.warning(f"Builder for type '{field_type}' failed: {e!r}")
+                    logger.warning("Builder for type '%s' failed: %r", field_type, e)
                 if STRICT_FIELDS:
                     raise
         if STRICT_FIELDS:
@@ -401,6 +350,23 @@ def get_field_plugin_manager() -> pluggy.PluginManager:
 
 
 # --- Core rule registration (executed at import time) ---
+# Exact field names that determine the field type regardless of node type
+# (any other name ending in ``_model`` is also a model field).
+_FIELD_NAME_TYPES: dict[str, str] = {
+    "board": "board",
+    "model": "model",
+    "image": "image",
+    "scheduler": "enum",
+}
+# Primitive node types whose single input takes the node's own type
+_NODE_PRIMITIVE_TYPES: dict[str, str] = {
+    "string": "string",
+    "integer": "integer",
+    "float": "float",
+    "float_math": "float",
+    "boolean": "boolean",
+}
+
 def _register_core_detection_rules() -> None:
     """Register the built‑in detection heuristics as prioritized rules.
 
@@ -425,17 +391,26 @@ def _register_core_detection_rules() -> None:
         name="explicit_type_hint",
     )
 
-    # Field name patterns
-    register_detection_rule("board", lambda node_type, field_name, field_info: field_name == "board", priority=10, name="field_name_board")
-    register_detection_rule("model", lambda node_type, field_name, field_info: field_name == "model" or field_name.endswith("_model"), priority=10, name="field_name_model")
-    register_detection_rule("image", lambda node_type, field_name, field_info: field_name == "image", priority=10, name="field_name_image")
-    register_detection_rule("enum", lambda node_type, field_name, field_info: field_name == "scheduler", priority=10, name="field_name_scheduler")
+    # Field name patterns (one table lookup instead of a rule per name)
+    def _field_name_type(node_type: str, field_name: str, field_info: dict[str, Any]) -> str | None:
+        field_type = _FIELD_NAME_TYPES.get(field_name)
+        if field_type is None and field_name.endswith("_model"):
+            return "model"
+        return field_type
+    register_detection_rule(
+        _field_name_type,  # type: ignore[arg-type]
+        predicate=lambda node_type, field_name, field_info: _field_name_type(node_type, field_name, field_info) is not None,
+        priority=10,
+        name="field_name_table",
+    )
 
     # Node primitive types
-    register_detection_rule("string", lambda node_type, field_name, field_info: node_type == "string", priority=20, name="node_primitive_string")
-    register_detection_rule("integer", lambda node_type, field_name, field_info: node_type == "integer", priority=20, name="node_primitive_integer")
-    register_detection_rule("float", lambda node_type, field_name, field_info: node_type in {"float", "float_math"}, priority=20, name="node_primitive_float")
-    register_detection_rule("boolean", lambda node_type, field_name, field_info: node_type == "boolean", priority=20, name="node_primitive_boolean")
+    register_detection_rule(
+        lambda node_type, field_name, field_info: _NODE_PRIMITIVE_TYPES[node_type],
+        predicate=lambda node_type, field_name, field_info: node_type in _NODE_PRIMITIVE_TYPES,
+        priority=20,
+        name="node_primitive_table",
+    )
 
     # Value-based
     register_detection_rule("boolean", lambda node_type, field_name, field_info: isinstance(field_info.get("value"), bool), priority=30, name="value_is_bool")
@@ -450,8 +425,14 @@ def _register_core_detection_rules() -> None:
         return False
     register_detection_rule("integer", _value_is_integer, priority=31, name="value_is_integer_like")
     register_detection_rule("float", lambda node_type, field_name, field_info: isinstance(field_info.get("value"), float), priority=32, name="value_is_float")
-    register_detection_rule("model", lambda node_type, field_name, field_info: isinstance(field_info.get("value"), dict) and ("key" in field_info["value"] or ("name" in field_info["value"] and "type" in field_info["value"])), priority=35, name="value_is_model_dict")
-    register_detection_rule("board", lambda node_type, field_name, field_info: isinstance(field_info.get("value"), dict) and "board_id" in field_info["value"], priority=37, name="value_is_board_dict")
+    def _value_is_model_dict(node_type: str, field_name: str, field_info: dict[str, Any]) -> bool:
+        v = field_info.get("value")
+        return isinstance(v, dict) and ("key" in v or ("name" in v and "type" in v))
+    register_detection_rule("model", _value_is_model_dict, priority=35, name="value_is_model_dict")
+    def _value_is_board_dict(node_type: str, field_name: str, field_info: dict[str, Any]) -> bool:
+        v = field_info.get("value")
+        return isinstance(v, dict) and "board_id" in v
+    register_detection_rule("board", _value_is_board_dict, priority=37, name="value_is_board_dict")
     register_detection_rule("string", lambda node_type, field_name, field_info: isinstance(field_info.get("value"), str), priority=40, name="value_is_string")
 
     # Enum heuristics
@@ -459,8 +440,6 @@ def _register_core_detection_rules() -> None:
 
     # Numeric constraints fallback (attempt integer then float)
     def _numeric_constraints_integer(node_type: str, field_name: str, field_info: dict[str, Any]) -> bool:
-        if not any(k in field_info for k in ("minimum", "maximum")):
-            return False
         mn, mx = field_info.get("minimum"), field_info.get("maximum")
         return isinstance(mn, int) and isinstance(mx, int)
     register_detection_rule("integer", _numeric_constraints_integer, priority=60, name="numeric_constraints_integer")
@@ -512,13 +491,7 @@ def _builder_integer(value: Any, field_info: dict[str, Any]) -> IvkField[Any]:
     """
     if isinstance(value, float) and value.is_integer():
         value = int(value)
-    int_value: int | None
-    if isinstance(value, int) and not isinstance(value, bool):
-        int_value = value
-    elif value is None:
-        int_value = None
-    else:
-        int_value = int(value) if isinstance(value, float) and value.is_integer() else None
+    int_value = value if isinstance(value, int) and not isinstance(value, bool) else None
     return IvkIntegerField(value=int_value, minimum=field_info.get("minimum"), maximum=field_info.get("maximum"))
 
 
@@ -540,7 +513,7 @@ def _builder_model(value: Any, field_info: dict[str, Any]) -> IvkField[Any]:
     """
     if isinstance(value, dict):
         if not value.get("key") and not value.get("name") and FIELD_DEBUG:
-            logger.warning(f"Model field missing key and name: {field_info}")
+            logger.warning("Model field missing key and name: %s", field_info)
         return IvkModelIdentifierField(
             key=value.get("key", ""),
             hash=value.get("hash", ""),
@@ -576,7 +549,7 @@ def _builder_image(value: Any, field_info: dict[str, Any]) -> IvkField[Any]:
     if isinstance(value, dict):
         image_name = value.get("image_name")
         if image_name is None and FIELD_DEBUG:
-            logger.warning(f"Image field missing image_name key; got {value!r}")
+            logger.warning("Image field missing image_name key; got %r", value)
         return IvkImageField(value=image_name)
     if value is None or isinstance(value, str):
         return IvkImageField(value=value)
@@ -607,10 +580,36 @@ def _register_core_field_builders() -> None:
 _register_core_field_builders()
 
 
+def _sole_core_plugin(pm: pluggy.PluginManager) -> CoreFieldPlugin | None:
+    """Return the core plugin when it is the only one registered, else ``None``.
+
+    With a single implementation a ``firstresult`` hook call returns exactly that
+    implementation's result, so callers may invoke it directly and skip pluggy's
+    per-call dispatch (the common case: no external field plugins installed).
+    """
+    plugins = pm.get_plugins()
+    if len(plugins) == 1:
+        (only,) = plugins
+        if isinstance(only, CoreFieldPlugin):
+            return only
+    return None
+
+
 def reset_field_plugin_manager() -> None:
     """Reset the global plugin manager (test / dynamic reconfiguration helper)."""
-    global _pm
+    global _pm, _registry_version
     _pm = None
+    _registry_version += 1
+
+
+def registry_version() -> tuple[int, int]:
+    """Return a token that changes whenever detection/build results may change.
+
+    Combines a counter bumped by the ``register_*`` / ``reset_*`` helpers with the
+    number of plugins on the current manager (covering plugins registered
+    directly on it). Callers caching detected fields compare against this.
+    """
+    return _registry_version, len(_pm.get_plugins()) if _pm is not None else 0
 
 
 def register_field_plugin(plugin: object, *, first: bool = False) -> None:
@@ -624,10 +623,11 @@ def register_field_plugin(plugin: object, *, first: bool = False) -> None:
         When ``True`` the plugin is placed ahead of existing ones, giving it
         higher precedence for hook resolution.
     """
-    global _pm
+    global _pm, _registry_version
     if _pm is None:
         get_field_plugin_manager()
     assert _pm is not None
+    _registry_version += 1
     if not first:
         _pm.register(plugin)
         return
@@ -661,7 +661,11 @@ def detect_field_type(node_type: str, field_name: str, field_info: dict[str, Any
         Detected field type or ``"string"`` fallback.
     """
     pm = get_field_plugin_manager()
-    result = pm.hook.detect_field_type(node_type=node_type, field_name=field_name, field_info=field_info)
+    core = _sole_core_plugin(pm)
+    if core is not None:
+        result = core.detect_field_type(node_type, field_name, field_info)
+    else:
+        result = pm.hook.detect_field_type(node_type=node_type, field_name=field_name, field_info=field_info)
     if result is None:
         if STRICT_FIELDS:
             raise ValueError(
@@ -669,7 +673,9 @@ def detect_field_type(node_type: str, field_name: str, field_info: dict[str, Any
             )
         if FIELD_DEBUG:
             logger.debug(
-                f"No plugin detected field type for: node={node_type}, field={field_name}; falling back to 'string'"
+                "No plugin detected field type for: node=%s, field=%s; falling back to 'string'",
+                node_type,
+                field_name,
             )
         return "string"  # fallback
     return str(result)
@@ -695,18 +701,26 @@ def build_field(node_data: dict[str, Any], field_name: str, field_info: dict[str
     pm = get_field_plugin_manager()
     
     # First detect the field type
+    # node types repeat across a workflow; interning lets the table
+    # lookups in detection hit CPython's identity fast path
     node_type = node_data.get("type", "")
+    if type(node_type) is str:
+        node_type = sys.intern(node_type)
     field_type = detect_field_type(node_type, field_name, field_info)
     
     # Then build the field
     value = field_info.get("value")
-    fld = pm.hook.build_field(field_type=field_type, value=value, field_info=field_info)
+    core = _sole_core_plugin(pm)
+    if core is not None:
+        fld = core.build_field(field_type, value, field_info)
+    else:
+        fld = pm.hook.build_field(field_type=field_type, value=value, field_info=field_info)
     if fld is not None:
-        return fld  # type: ignore[no-any-return]
+        return fld
     
     # Fallback safety with warning
     if FIELD_DEBUG:
-        logger.debug(f"No plugin could build field type '{field_type}', falling back to string")
+        logger.debug("No plugin could build field type '%s', falling back to string", field_type)
     
     # Deep copy value if mutable
     if isinstance(value, (dict, list)):
@@ -24,9 +24,11 @@ DISCLAIMER: This is a pragmatic snapshot, not an authoritative schema.
 """
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
 from typing import Any, Optional
-from collections.abc import Iterable
-from pydantic import BaseModel, Field, ConfigDict
+from collections.abc import Iterable, Mapping
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationError
 
 # ---------------------------------------------------------------------------
 # Core Graph Models
@@ -89,6 +91,20 @@ class WorkflowForm(BaseModel):
     model_config = ConfigDict(extra='allow')
     elements: dict[str, WorkflowFormElement] = Field(default_factory=dict)
 
+    @property
+    def node_field_elements(self) -> list[WorkflowFormElement]:
+        """``node-field`` elements that carry a ``fieldIdentifier``, in form order.
+
+        Filtered on every access (a single pass over ``elements``), so element
+        replacements and in-place ``fieldIdentifier`` edits are always seen.
+        Upstream form element types are open-ended (container, divider, text, ...),
+        so this is a filter rather than a closed discriminated union.
+        """
+        return [
+            elem for elem in self.elements.values()
+            if elem.type == 'node-field' and elem.data.fieldIdentifier
+        ]
+
 class WorkflowRoot(BaseModel):
     model_config = ConfigDict(extra='allow')
     id: Optional[str] = None
@@ -105,21 +121,35 @@ class WorkflowRoot(BaseModel):
         We intentionally keep the underlying storage (`nodes` list of dict) intact for
         backward compatibility with existing code/tests that expect raw dicts.
         """
-        for nd in self.nodes:
-            # Guard against malformed entries
-            if not isinstance(nd, dict) or 'id' not in nd or 'data' not in nd:
-                continue
+        # Guard against malformed entries
+        candidates = [
+            nd for nd in self.nodes
+            if isinstance(nd, dict) and 'id' in nd and 'data' in nd
+        ]
+        try:
+            # One validator call for the whole list in the common all-valid case
+            typed = _WORKFLOW_NODE_LIST_ADAPTER.validate_python(candidates)
+        except ValidationError:
+            typed = None
+        if typed is not None:
+            yield from typed
+            return
+        for nd in candidates:
             try:
-                yield WorkflowNode(**nd)  # type: ignore[arg-type]
-            except Exception:
+                yield _WORKFLOW_NODE_ADAPTER.validate_python(nd)
+            except ValidationError:
                 # Skip nodes that fail validation (forward compatibility)
                 continue
 
     def get_typed_node(self, node_id: str) -> WorkflowNode | None:
-        for n in self.iter_typed_nodes():
-            if n.id == node_id:
-                return n
-        return None
+        """Return the node with ``node_id`` as a `WorkflowNode`, validating only that node."""
+        nd = index_nodes(self).get(node_id)
+        if nd is None or 'data' not in nd:
+            return None
+        try:
+            return _WORKFLOW_NODE_ADAPTER.validate_python(nd)
+        except ValidationError:
+            return None
 
     def replace_typed_node(self, node: WorkflowNode) -> None:
         """Replace underlying raw dict for a node with contents of provided `WorkflowNode`.
@@ -133,11 +163,15 @@ class WorkflowRoot(BaseModel):
                 return
         self.nodes.append(dumped)
 
+# Built once at import; reused by the typed-node helpers instead of rebuilding validators per call
+_WORKFLOW_NODE_ADAPTER: TypeAdapter[WorkflowNode] = TypeAdapter(WorkflowNode)
+_WORKFLOW_NODE_LIST_ADAPTER: TypeAdapter[list[WorkflowNode]] = TypeAdapter(list[WorkflowNode])
+
 # ---------------------------------------------------------------------------
 # Utility Functions
 # ---------------------------------------------------------------------------
 
-OUTPUT_CAPABLE_TYPES = {
+OUTPUT_CAPABLE_TYPES: frozenset[str] = frozenset(map(sys.intern, (
     "save_image",
     "l2i",
     "flux_vae_decode",
@@ -145,7 +179,7 @@ OUTPUT_CAPABLE_TYPES = {
     "hed_edge_detection",
     # Common additional decode / save patterns (heuristic growth point)
     "image_output",
-}
+)))
 
 def is_output_node_type(node_type: str | None) -> bool:
     """Heuristic to decide if a node type is image-output capable.
@@ -166,9 +200,16 @@ def is_output_node_type(node_type: str | None) -> bool:
         or 'decode' in lt
     )
 
-def load_workflow_json(data: dict[str, Any]) -> WorkflowRoot:
-    """Load raw workflow JSON dict into `WorkflowRoot` model preserving unknown fields."""
-    return WorkflowRoot(**data)
+def load_workflow_json(data: Mapping[str, Any]) -> WorkflowRoot:
+    """Load raw workflow JSON dict into `WorkflowRoot` model preserving unknown fields.
+
+    Prefer ``load_workflow_json_bytes`` when the workflow is still a file or string.
+    """
+    return WorkflowRoot.model_validate(data)
+
+def load_workflow_json_bytes(raw: bytes | str) -> WorkflowRoot:
+    """Parse workflow JSON text straight into `WorkflowRoot` (no intermediate dict)."""
+    return WorkflowRoot.model_validate_json(raw)
 
 def workflow_to_dict(root: WorkflowRoot) -> dict[str, Any]:
     """Serialize `WorkflowRoot` (and any in-place mutations) back to InvokeAI-compatible dict.
@@ -181,20 +222,31 @@ def workflow_to_dict(root: WorkflowRoot) -> dict[str, Any]:
     """
     return root.model_dump(exclude_none=True)
 
-def update_node_input_value(root: WorkflowRoot, node_id: str, field_name: str, value: Any) -> bool:
+def dump_workflow_json(root: WorkflowRoot) -> bytes:
+    """Serialize `WorkflowRoot` straight to JSON bytes (same content as ``workflow_to_dict``).
+
+    Uses pydantic's Rust serializer, so no intermediate dict or ``json.dumps`` pass;
+    the result can be written to disk or passed back to ``load_workflow_json_bytes``.
+    """
+    return root.model_dump_json(exclude_none=True).encode()
+
+def update_node_input_value(
+    root: WorkflowRoot,
+    node_id: str,
+    field_name: str,
+    value: Any,
+    node_index: Mapping[Any, dict[str, Any]] | None = None,
+) -> bool:
     """Convenience mutator: update a node input field's `.value` if present.
 
     Returns True if updated, False if node or field not found.
     This mutates the underlying raw dict directly for efficiency and to avoid a full reparse.
+    Pass ``node_index`` (from ``index_nodes``) when updating many fields.
     """
-    for nd in root.nodes:
-        if isinstance(nd, dict) and nd.get('id') == node_id:
-            inputs = ((nd.get('data') or {}).get('inputs') or {})
-            field_dict = inputs.get(field_name)
-            if isinstance(field_dict, dict):
-                field_dict['value'] = value
-                return True
-            return False
+    field_dict = resolve_input_field(root, node_id, field_name, node_index)
+    if isinstance(field_dict, dict):
+        field_dict['value'] = value
+        return True
     return False
 
 def is_field_connected(root: WorkflowRoot, node_id: str, field_name: str) -> bool:
@@ -211,26 +263,70 @@ def is_field_connected(root: WorkflowRoot, node_id: str, field_name: str) -> boo
             continue
     return False
 
-def iter_form_input_fields(root: WorkflowRoot):
-    """Yield tuples (node_id, field_name, element_id, field_model)."""
-    elements = root.form.elements
-    for elem in elements.values():
-        if elem.type == 'node-field' and elem.data.fieldIdentifier:
-            fid = elem.data.fieldIdentifier
-            node_id = fid.get('nodeId')
-            field_name = fid.get('fieldName')
-            # Find node data
-            node_obj = next((n for n in root.nodes if n.get('id') == node_id), {})
-            inputs = ((node_obj.get('data') or {}).get('inputs') or {})
-            field_model = inputs.get(field_name)
-            yield node_id, field_name, elem.id, field_model
+def index_nodes(root: WorkflowRoot) -> dict[Any, dict[str, Any]]:
+    """Map node id -> raw node dict in one pass (first occurrence wins for duplicate ids).
+
+    Build it once and pass it as ``node_index`` to ``resolve_input_field``,
+    ``update_node_input_value`` or ``iter_form_input_fields`` when resolving many
+    fields; rebuild it after adding, removing or replacing nodes.
+    """
+    index: dict[Any, dict[str, Any]] = {}
+    for n in root.nodes:
+        if isinstance(n, dict):
+            index.setdefault(n.get('id'), n)
+    return index
+
+def resolve_input_field(
+    root: WorkflowRoot,
+    node_id: str,
+    field_name: str,
+    node_index: Mapping[Any, dict[str, Any]] | None = None,
+) -> Any:
+    """Return the raw input field dict for (node_id, field_name), or None.
+
+    In-process equivalent of evaluating ``build_input_jsonpath(node_id, field_name)``
+    but via direct dict lookups instead of a filter scan over ``root.nodes``.
+    Pass ``node_index`` (from ``index_nodes``) when resolving many fields.
+    """
+    if node_index is None:
+        node_index = index_nodes(root)
+    node_obj = node_index.get(node_id)
+    if node_obj is None:
+        return None
+    return ((node_obj.get('data') or {}).get('inputs') or {}).get(field_name)
+
+def iter_form_input_fields(root: WorkflowRoot, node_index: Mapping[Any, dict[str, Any]] | None = None):
+    """Yield tuples (node_id, field_name, element_id, field_model).
+
+    ``node_index`` (as built by ``index_nodes``) may be passed by callers that
+    already hold one; otherwise it is built once per call so each form element
+    resolves its node in O(1).
+    """
+    if node_index is None:
+        node_index = index_nodes(root)
+    for elem in root.form.node_field_elements:
+        fid = elem.data.fieldIdentifier or {}
+        # Raw JSON values; malformed identifiers simply resolve to None
+        node_id: Any = fid.get('nodeId')
+        field_name: Any = fid.get('fieldName')
+        field_model = resolve_input_field(root, node_id, field_name, node_index)
+        yield node_id, field_name, elem.id, field_model
+
+def _collect_board_exposed_ids(root: WorkflowRoot) -> set[Any]:
+    """Return ids of nodes whose ``board`` field is exposed in the form (no node lookups)."""
+    exposed: set[Any] = set()
+    for elem in root.form.node_field_elements:
+        fid = elem.data.fieldIdentifier or {}
+        if fid.get('fieldName') == 'board':
+            exposed.add(fid.get('nodeId'))
+    return exposed
 
 def enumerate_output_nodes(root: WorkflowRoot):
     """Yield tuples of (node_id, node_type, has_board_field_exposed).
 
     Uses heuristic `is_output_node_type` plus explicit board field exposure detection.
     """
-    exposed_board_node_ids = {n for (n, fname, _eid, _f) in iter_form_input_fields(root) if fname == 'board'}
+    exposed_board_node_ids = _collect_board_exposed_ids(root)
     for node in root.nodes:
         if not isinstance(node, dict):
             continue
@@ -273,8 +369,21 @@ def build_input_jsonpath(node_id: str, field_name: str) -> str:
     """Replicate existing JSONPath pattern used by partial system."""
     return f"$.nodes[?(@.id='{node_id}')].data.inputs.{field_name}"
 
+@lru_cache(maxsize=4096)
+def build_input_jsonpath_parsed(node_id: str, field_name: str) -> Any:
+    """Return the compiled ``jsonpath_ng`` expression for ``build_input_jsonpath``.
+
+    Parsing is the expensive part of jsonpath-ng, so each (node_id, field_name)
+    pair is compiled once per process and reused.
+    """
+    # local import keeps module import light; jsonpath-ng ships no type hints
+    from jsonpath_ng.ext import parse  # type: ignore[attr-defined]
+
+    expr: Any = parse(build_input_jsonpath(node_id, field_name))  # type: ignore[no-untyped-call]
+    return expr
+
 __all__ = [
     'WorkflowRoot', 'WorkflowNode', 'WorkflowNodeData', 'WorkflowNodeField', 'WorkflowEdge', 'WorkflowEdgeEndpoint',
-    'WorkflowForm', 'WorkflowFormElement', 'WorkflowFormElementData', 'load_workflow_json', 'iter_form_input_fields',
-    'enumerate_output_nodes', 'build_input_jsonpath', 'OUTPUT_CAPABLE_TYPES', 'workflow_to_dict', 'update_node_input_value', 'is_field_connected', 'is_output_node_type', 'update_output_boards'
+    'WorkflowForm', 'WorkflowFormElement', 'WorkflowFormElementData', 'load_workflow_json', 'load_workflow_json_bytes', 'iter_form_input_fields',
+    'enumerate_output_nodes', 'build_input_jsonpath', 'build_input_jsonpath_parsed', 'OUTPUT_CAPABLE_TYPES', 'workflow_to_dict', 'dump_workflow_json', 'update_node_input_value', 'resolve_input_field', 'index_nodes', 'is_field_connected', 'is_output_node_type', 'update_output_boards'
 ]
@@ -8,15 +8,17 @@ of a workflow and manages input configuration, submission, and result retrieval.
 from __future__ import annotations
 
 import asyncio
+import copy
+import datetime
 import os
+import sys
 import time
 from typing import TYPE_CHECKING, Any, Callable, TypedDict
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Mapping
 import json
 
 # JSONPath retained only for backward compatibility (may be phased out after upstream model integration)
 # (Legacy JSONPath import removed after upstream model integration)
-from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 
 from invokeai_py_client.ivk_fields import (
     IvkBoardField,
@@ -29,11 +31,8 @@ from invokeai_py_client.ivk_fields import (
 )
 from invokeai_py_client.ivk_fields.base import IvkField
 from invokeai_py_client.workflow import field_plugins
+from invokeai_py_client.workflow.upstream_models import build_input_jsonpath
 from invokeai_py_client.models import IvkJob
-from invokeai_py_client.workflow.upstream_models import (
-    load_workflow_json,
-    is_field_connected,
-)
 
 if TYPE_CHECKING:
     from invokeai_py_client.client import InvokeAIClient
@@ -41,10 +40,48 @@ if TYPE_CHECKING:
     from invokeai_py_client.ivk_fields.models import IvkModelIdentifierField
 
 
-class IvkWorkflowInput(BaseModel):
+# Env flags (read once at import, like field_plugins.FIELD_DEBUG)
+_DEBUG_WORKFLOW = bool(os.environ.get("DEBUG_WORKFLOW"))
+
+# Queue item states reported by the server once a submission has finished
+_TERMINAL_QUEUE_STATUSES: frozenset[str] = frozenset({"completed", "failed", "canceled"})
+
+# Node types that have board output capability (WithBoard mixin).
+# These are the types that can save outputs to boards.
+_BOARD_OUTPUT_NODE_TYPES: frozenset[str] = frozenset({
+    "save_image",
+    "l2i",  # Latents to Image
+    "flux_vae_decode",
+    "flux_vae_encode",
+    "hed_edge_detection",
+})
+
+# Field classes whose emptiness is expressed by ``value is None``; used by the
+# required-input check in ``IvkWorkflowInput.validate_input``.
+_VALUE_FIELD_TYPES: tuple[type[IvkField[Any]], ...] = (
+    IvkStringField,
+    IvkIntegerField,
+    IvkFloatField,
+    IvkBooleanField,
+    IvkEnumField,
+    IvkBoardField,
+    IvkImageField,
+)
+
+
+def _intern(value: Any) -> Any:
+    """``sys.intern`` for exact ``str`` values; anything else is returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class IvkWorkflowInput:
     """
     Represents a single workflow input with metadata and typed field.
 
+    A plain ``__slots__`` class: one instance is created per form field for
+    every handle, so it carries no per-instance ``__dict__`` or model
+    validation machinery.
+
     Attributes
     ----------
     label : str
@@ -63,18 +100,30 @@ class IvkWorkflowInput(BaseModel):
         0-based index from form tree traversal.
     jsonpath : str
         JSONPath expression to locate this field in the workflow JSON.
+    is_value_field : bool
+        Read-only; whether ``field`` signals "unset" via ``value is None``.
 
     Field Type Immutability
     -----------------------
-    After the model is first instantiated, the concrete Python class of the
+    After the input is first instantiated, the concrete Python class of the
     `.field` attribute is locked. Any subsequent reassignment of `.field` must
     be an instance of the exact same class (not just a subclass). Attempting to
     assign a different concrete field type raises ``TypeError``. This ensures
     stable downstream logic that may rely on the original field interface.
     """
 
-    # Enable arbitrary types and assignment validation so our model_validator runs on re-assignment.
-    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
+    __slots__ = (
+        "label",
+        "node_name",
+        "node_id",
+        "field_name",
+        "field",
+        "required",
+        "input_index",
+        "jsonpath",
+        "_field_type",
+        "_is_value_field",
+    )
 
     label: str
     node_name: str
@@ -84,26 +133,71 @@ class IvkWorkflowInput(BaseModel):
     required: bool
     input_index: int
     jsonpath: str  # JSONPath expression for efficient field location
+    # Concrete type of `field` remembered at first assignment.
+    _field_type: type[IvkField[Any]] | None
+    # Whether that type expresses emptiness as ``value is None`` (see is_value_field)
+    _is_value_field: bool
 
-    # Private attribute to remember the concrete type of `field` after first initialization.
-    _field_type: type[IvkField[Any]] | None = PrivateAttr(default=None)
+    def __init__(
+        self,
+        *,
+        label: str,
+        node_name: str,
+        node_id: str,
+        field_name: str,
+        field: IvkField[Any],
+        required: bool,
+        input_index: int,
+        jsonpath: str,
+    ) -> None:
+        self._field_type = None
+        self._is_value_field = False
+        self.label = label
+        self.node_name = node_name
+        self.node_id = node_id
+        self.field_name = field_name
+        self.field = field
+        self.required = required
+        self.input_index = input_index
+        self.jsonpath = jsonpath
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Capture the initial concrete type of `field` and enforce exact-type reassignments."""
+        if name == "field" and value is not None:
+            if self._field_type is None:
+                object.__setattr__(self, "_field_type", type(value))
+                object.__setattr__(self, "_is_value_field", isinstance(value, _VALUE_FIELD_TYPES))
+            elif type(value) is not self._field_type:
+                raise TypeError(
+                    "Cannot reassign 'field' with different type: "
+                    f"expected {self._field_type.__name__}, got {type(value).__name__}"
+                )
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Slot values for ``copy`` / ``pickle`` (there is no ``__dict__``)."""
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore slots directly; ``__setattr__`` would consult ``_field_type`` before it is set."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return (
+            f"IvkWorkflowInput(label={self.label!r}, node_name={self.node_name!r}, "
+            f"node_id={self.node_id!r}, field_name={self.field_name!r}, field={self.field!r}, "
+            f"required={self.required!r}, input_index={self.input_index!r}, jsonpath={self.jsonpath!r})"
+        )
 
-    @model_validator(mode="after")
-    def _lock_field_type(self) -> IvkWorkflowInput:
-        """Capture the initial concrete type of `field` and enforce exact-type reassignments.
+    @property
+    def is_value_field(self) -> bool:
+        """Whether ``field`` is a value-style field (emptiness is ``field.value is None``).
 
-        Runs after model creation and again on any assignment (validate_assignment=True).
+        Fixed by the locked field type, so it is computed once instead of
+        probing the field on every validation.
         """
-        if self.field is not None:
-            if self._field_type is None:
-                self._field_type = type(self.field)
-            else:
-                if type(self.field) is not self._field_type:
-                    raise TypeError(
-                        "Cannot reassign 'field' with different type: "
-                        f"expected {self._field_type.__name__}, got {type(self.field).__name__}"
-                    )
-        return self
+        return self._is_value_field
 
     def validate_input(self) -> bool:
         """
@@ -125,15 +219,40 @@ class IvkWorkflowInput(BaseModel):
         Required fields with None values will raise a ValueError.
         """
         # Check if required field has value
-        if self.required:
+        if self.required and self._is_value_field:
             # Best-effort check for value-style fields
-            if isinstance(self.field, (IvkStringField, IvkIntegerField, IvkFloatField, IvkBooleanField, IvkEnumField, IvkBoardField, IvkImageField)):
-                if getattr(self.field, 'value', None) is None:
-                    raise ValueError(f"Required field '{self.label}' is not set")
+            if getattr(self.field, 'value', None) is None:
+                raise ValueError(f"Required field '{self.label}' is not set")
         
         # Delegate to field's validation
         return self.field.validate_field()
 
+    def validate_input_errors(self) -> list[str]:
+        """
+        Validate the workflow input and return error messages instead of raising.
+
+        Returns
+        -------
+        list[str]
+            Validation error messages; empty when the input is valid.
+
+        Notes
+        -----
+        The missing-required-value check is answered without raising. Only
+        the field's own ``validate_field`` may raise, and its exceptions are
+        converted to messages here.
+        """
+        if self.required and self._is_value_field and getattr(self.field, 'value', None) is None:
+            return [f"Required field '{self.label}' is not set"]
+        try:
+            self.field.validate_field()
+        except ValueError as e:
+            return [str(e)]
+        except Exception as e:
+            # Catch any other validation errors
+            return [f"Validation error: {str(e)}"]
+        return []
+
 
 # Type alias - outputs are board fields exposed in the form
 IvkWorkflowOutput = IvkWorkflowInput
@@ -208,6 +327,24 @@ class WorkflowHandle:
     >>> job = workflow.submit_sync()
     """
 
+    # Fixed attribute set (no per-instance __dict__); extend when adding state in __init__
+    __slots__ = (
+        "client",
+        "definition",
+        "inputs",
+        "job",
+        "uploaded_assets",
+        "_root",
+        "batch_id",
+        "item_id",
+        "session_id",
+        "_outputs",
+        "_api_graph_plan",
+        "_inputs_by_label",
+        "_inputs_by_field",
+        "__weakref__",
+    )
+
     def __init__(self, client: InvokeAIClient, definition: WorkflowDefinition) -> None:
         """Initialize the workflow handle."""
         self.client = client
@@ -217,9 +354,10 @@ class WorkflowHandle:
         self.uploaded_assets: list[str] = []
 
         # Upstream workflow root model (forward-compatible structured representation)
-        # Loaded from the raw definition dict; mutations applied during conversion only.
+        # Parsed once per definition and shared between handles; mutations applied
+        # during conversion only.
         try:
-            self._root = load_workflow_json(self.definition.to_dict())
+            self._root = self.definition.get_workflow_root()
         except Exception:
             # Fail softly; retain legacy path if parsing fails
             self._root = None  # type: ignore[assignment]
@@ -229,6 +367,17 @@ class WorkflowHandle:
         self.item_id: int | None = None
         self.session_id: str | None = None
 
+        # Board inputs of output-capable nodes, resolved on first list_outputs()
+        self._outputs: tuple[IvkWorkflowOutput, ...] | None = None
+
+        # Input-independent part of the API graph, built on first conversion
+        self._api_graph_plan: tuple[Any, ...] | None = None
+
+        # Lookup tables filled by _initialize_inputs (label -> inputs in order,
+        # (node_id, field_name) -> first matching input)
+        self._inputs_by_label: dict[str, list[IvkWorkflowInput]] = {}
+        self._inputs_by_field: dict[tuple[str, str], IvkWorkflowInput] = {}
+
         # Initialize inputs from the workflow definition
         self._initialize_inputs()
 
@@ -236,8 +385,49 @@ class WorkflowHandle:
         """
         Initialize workflow inputs from the definition.
 
-        This parses the form structure and GUI-public fields to create
-        the ordered list of IvkWorkflowInput objects.
+        The form traversal and field-type detection run once per definition
+        revision (and field-plugin registry state); the result is kept on the
+        definition as a template and every handle gets its own deep copies of
+        the template's prototype fields. Default values therefore reflect the
+        definition as of its current revision: after editing ``raw_data`` in
+        place, call ``definition.mark_changed()`` before creating new handles.
+        """
+        definition = self.definition
+        template = definition._input_template
+        token = field_plugins.registry_version()
+        if template is None or template[0] != definition.revision or template[1] != token:
+            specs = self._collect_input_specs()
+            # Detection may have created the plugin manager; take the token afterwards
+            template = definition._input_template = (
+                definition.revision, field_plugins.registry_version(), specs
+            )
+
+        self.inputs.extend(
+            IvkWorkflowInput(
+                label=label,
+                node_name=node_name,
+                node_id=node_id,
+                field_name=field_name,
+                field=copy.deepcopy(prototype),
+                required=required,
+                input_index=input_index,
+                jsonpath=jsonpath,
+            )
+            for input_index, (label, node_name, node_id, field_name, required, jsonpath, prototype)
+            in enumerate(template[2])
+        )
+        for inp in self.inputs:
+            self._inputs_by_label.setdefault(inp.label, []).append(inp)
+            self._inputs_by_field.setdefault((inp.node_id, inp.field_name), inp)
+
+    def _collect_input_specs(self) -> tuple[tuple[Any, ...], ...]:
+        """
+        Walk the form and describe each GUI-public field, in input order.
+
+        This parses the form structure and GUI-public fields to produce, per
+        input, ``(label, node_name, node_id, field_name, required, jsonpath,
+        prototype_field)``. Prototype fields belong to the shared template and
+        must only be copied, never handed out.
 
         Terminology note:
         "GUI-public fields" refers to node input fields that have been intentionally
@@ -248,30 +438,39 @@ class WorkflowHandle:
         """
         # Prefer upstream model if available for form elements & nodes
         _root_obj = getattr(self, "_root", None)
+        form_elements: Any = None
+        element_is_model = False
         if _root_obj is not None:
             try:
                 form_elements = _root_obj.form.elements  # type: ignore[attribute-defined-outside-init]
-                nodes = {n.get("id"): n for n in _root_obj.nodes if isinstance(n, dict)}  # type: ignore[attribute-defined-outside-init]
                 element_is_model = True
             except Exception:
-                form_elements = self.definition.form.get("elements", {})
-                nodes = {node["id"]: node for node in self.definition.nodes}
-                element_is_model = False
-        else:
-            form_elements = self.definition.form.get("elements", {})
-            nodes = {node["id"]: node for node in self.definition.nodes}
-            element_is_model = False
+                pass
+        if not element_is_model:
+            form_elements = self.definition.form.get("elements")
+
+        # Workflows without a form tree (e.g. utility graphs) expose no inputs;
+        # skip the node index and traversal entirely.
+        if not form_elements or "root" not in form_elements:
+            return ()
 
-        # Track input index
-        input_index = 0
+        nodes: Mapping[Any, dict[str, Any]]
+        if element_is_model:
+            nodes = {n.get("id"): n for n in _root_obj.nodes if isinstance(n, dict)}  # type: ignore[union-attr]
+        else:
+            nodes = self.definition.nodes_by_id
 
-        def traverse_form(elem_id: str) -> None:
-            """Traverse form tree and collect node-field elements."""
-            nonlocal input_index
+        specs: list[tuple[Any, ...]] = []
 
+        # Depth-first, pre-order walk of the form tree from "root" using an
+        # explicit stack; children are pushed reversed so they pop in order.
+        stack: list[str] = ["root"]
+        expanded: set[str] = set()
+        while stack:
+            elem_id = stack.pop()
             elem = form_elements.get(elem_id)
             if not elem:
-                return
+                continue
 
             # Support both dict and model element forms
             if element_is_model:
@@ -286,17 +485,22 @@ class WorkflowHandle:
                 field_identifier = elem_data.get("fieldIdentifier")
 
             if elem_type == "container":
-                # Process children in order
-                for child_id in children:
-                    traverse_form(child_id)
+                # A malformed form could nest a container inside itself;
+                # expand each container once instead of looping forever.
+                if elem_id in expanded:
+                    continue
+                expanded.add(elem_id)
+                stack.extend(reversed(children))
 
             elif elem_type == "node-field":
                 # Extract field information (upstream model uses same structure)
                 field_id = field_identifier
                 if not field_id:
-                    return
+                    continue
                 node_id = field_id["nodeId"]
-                field_name = field_id["fieldName"]
+                # Interned up front: field detection compares it against
+                # literal names, and the spec stores it as-is.
+                field_name = _intern(field_id["fieldName"])
 
                 # Get node and field metadata
                 node = nodes.get(node_id, {})
@@ -321,25 +525,23 @@ class WorkflowHandle:
                 # Calculate JSONPath expression for this field
                 # Points to the entire field dict object (not just .value)
                 # We'll merge to_api_format() results with this dict
-                jsonpath_expr = f"$.nodes[?(@.id='{node_id}')].data.inputs.{field_name}"
-
-                # Create IvkWorkflowInput
-                workflow_input = IvkWorkflowInput(
-                    label=field_label,
-                    node_name=node_label,
-                    node_id=node_id,
-                    field_name=field_name,
-                    field=field_instance,
-                    required=required,
-                    input_index=input_index,
-                    jsonpath=jsonpath_expr
+                jsonpath_expr = build_input_jsonpath(node_id, field_name)
+
+                # Labels and field names repeat across inputs and handles (e.g.
+                # "value", "board"); intern them so copies share one object.
+                specs.append(
+                    (
+                        _intern(field_label),
+                        _intern(node_label),
+                        node_id,
+                        field_name,
+                        required,
+                        jsonpath_expr,
+                        field_instance,
+                    )
                 )
 
-                self.inputs.append(workflow_input)
-                input_index += 1
-
-        # Start traversal from root
-        traverse_form("root")
+        return tuple(specs)
 
     def _create_field_from_node(
         self, node_data: dict[str, Any], field_name: str, field_info: dict[str, Any]
@@ -394,14 +596,15 @@ class WorkflowHandle:
         # Delegate to plugin system for backward compatibility
         return field_plugins.detect_field_type(node_type, field_name, field_info)
 
-    def list_inputs(self) -> list[IvkWorkflowInput]:
+    def list_inputs(self) -> tuple[IvkWorkflowInput, ...]:
         """
         List all available workflow inputs.
 
         Returns
         -------
-        List[IvkWorkflowInput]
-            Ordered list of input definitions.
+        tuple[IvkWorkflowInput, ...]
+            Ordered, read-only sequence of input definitions. Use ``list(...)``
+            if a mutable copy is needed.
 
         Examples
         --------
@@ -409,7 +612,7 @@ class WorkflowHandle:
         >>> for inp in inputs:
         ...     print(f"[{inp.input_index}] {inp.label}")
         """
-        return self.inputs.copy()
+        return tuple(self.inputs)
 
     # ------------------------------------------------------------------
     # Index-centric convenience APIs (non-breaking additions)
@@ -445,7 +648,6 @@ class WorkflowHandle:
 
     def export_input_index_map(self, path: str | os.PathLike[str]) -> None:
         """Persist current input index mapping (for drift detection)."""
-        import datetime
         data = {
             "workflow_id": getattr(self.definition, "id", None),
             "generated_at": datetime.datetime.utcnow().isoformat() + "Z",
@@ -467,7 +669,6 @@ class WorkflowHandle:
 
         Returns dict with keys: unchanged, moved, missing, new.
         """
-        import json
         with open(path, encoding="utf-8") as fh:
             recorded = json.load(fh)
         current_by_jsonpath = {inp.jsonpath: inp for inp in self.inputs}
@@ -495,7 +696,7 @@ class WorkflowHandle:
                 report["new"].append({"index": inp.input_index, "label": inp.label})
         return report
     
-    def list_outputs(self) -> list[IvkWorkflowOutput]:
+    def list_outputs(self) -> tuple[IvkWorkflowOutput, ...]:
         """
         List all workflow output nodes.
         
@@ -505,8 +706,9 @@ class WorkflowHandle:
         
         Returns
         -------
-        List[IvkWorkflowOutput]
-            Ordered list of output nodes (board fields from output-capable nodes).
+        tuple[IvkWorkflowOutput, ...]
+            Ordered, read-only sequence of output nodes (board fields from
+            output-capable nodes).
             
         Notes
         -----
@@ -522,35 +724,22 @@ class WorkflowHandle:
         ...     # Set the board for this output
         ...     output.field.value = "my-board-id"
         """
-        # Node types that have board output capability (WithBoard mixin)
-        # These are the types that can save outputs to boards
-        output_capable_types = {
-            "save_image",
-            "l2i",  # Latents to Image
-            "flux_vae_decode",
-            "flux_vae_encode", 
-            "hed_edge_detection"
-        }
-        
-        # Get node type mapping
-        node_types = {}
-        for node in self.definition.nodes:
-            node_id = node.get("id")
-            node_data = node.get("data", {})
-            node_type = node_data.get("type", "")
-            node_types[node_id] = node_type
-        
-        # Filter inputs to find board fields from output-capable nodes
-        outputs = []
-        for inp in self.inputs:
-            # Check if this is a board field
-            if inp.field_name == "board":
-                # Check if the node is output-capable
-                node_type = node_types.get(inp.node_id, "")
-                if node_type in output_capable_types:
-                    outputs.append(inp)
-        
-        return outputs
+        # Inputs and node types are fixed for the handle, so the scan runs once
+        if self._outputs is None:
+            self._outputs = self._find_output_inputs()
+        return self._outputs
+
+    def _find_output_inputs(self) -> tuple[IvkWorkflowOutput, ...]:
+        """Select board inputs that belong to output-capable nodes (see ``list_outputs``)."""
+        nodes_by_id = self.definition.nodes_by_id
+
+        # Board fields from output-capable nodes
+        return tuple(
+            inp
+            for inp in self.inputs
+            if inp.field_name == "board"
+            and (nodes_by_id.get(inp.node_id) or {}).get("data", {}).get("type", "") in _BOARD_OUTPUT_NODE_TYPES
+        )
 
     def get_input(self, index: int) -> IvkWorkflowInput:
         """
@@ -576,17 +765,83 @@ class WorkflowHandle:
         >>> prompt_input = workflow.get_input(0)
         >>> prompt_input.field.value = "A sunset"
         """
-        if index < 0 or index >= len(self.inputs):
+        return self._input_at(index)
+
+    def _input_at(self, index: int) -> IvkWorkflowInput:
+        """Return ``self.inputs[index]``; raise IndexError for anything outside 0..N-1."""
+        # input_index equals list position (assigned sequentially in _initialize_inputs)
+        inputs = self.inputs
+        if not 0 <= index < len(inputs):
             raise IndexError(
-                f"Input index {index} out of range (0-{len(self.inputs) - 1})"
+                f"Input index {index} out of range (0-{len(inputs) - 1})"
             )
-        return self.inputs[index]
+        return inputs[index]
+
+    def get_input_by_label(self, label: str) -> IvkWorkflowInput:
+        """
+        Get a workflow input by its form label.
+
+        Parameters
+        ----------
+        label : str
+            The input label as shown in the workflow form.
+
+        Returns
+        -------
+        IvkWorkflowInput
+            The only input carrying this label.
+
+        Raises
+        ------
+        KeyError
+            If no input has this label.
+        ValueError
+            If several inputs share the label; use ``get_input_by_field`` or an
+            index instead.
+
+        Examples
+        --------
+        >>> workflow.get_input_by_label("Positive Prompt").field.value = "A sunset"
+        """
+        matches = self._inputs_by_label.get(label)
+        if not matches:
+            raise KeyError(f"No workflow input labeled {label!r}")
+        if len(matches) > 1:
+            indices = ", ".join(str(inp.input_index) for inp in matches)
+            raise ValueError(f"Label {label!r} is shared by inputs {indices}")
+        return matches[0]
+
+    def get_input_by_field(self, node_id: str, field_name: str) -> IvkWorkflowInput:
+        """
+        Get a workflow input by the node field it exposes.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node owning the field.
+        field_name : str
+            Name of the input field on that node.
+
+        Returns
+        -------
+        IvkWorkflowInput
+            The input bound to ``node_id.field_name``.
+
+        Raises
+        ------
+        KeyError
+            If the field is not exposed in the workflow form.
+        """
+        try:
+            return self._inputs_by_field[(node_id, field_name)]
+        except KeyError:
+            raise KeyError(f"Field {node_id}.{field_name} is not a workflow input") from None
 
     def validate_inputs(self) -> dict[int, list[str]]:
         """
         Validate all configured inputs.
 
-        Delegates validation to each IvkWorkflowInput's validate() method.
+        Collects each IvkWorkflowInput's ``validate_input_errors()`` result.
 
         Returns
         -------
@@ -601,23 +856,30 @@ class WorkflowHandle:
         ...     for idx, msgs in errors.items():
         ...         print(f"[{idx}]: {', '.join(msgs)}")
         """
-        errors: dict[int, list[str]] = {}
+        # input_index is unique per input, so each key is written once
+        return {
+            inp.input_index: errs
+            for inp in self.inputs
+            if (errs := inp.validate_input_errors())
+        }
 
-        # Validate each input using its validate_input() method
-        for inp in self.inputs:
-            try:
-                inp.validate_input()
-            except ValueError as e:
-                if inp.input_index not in errors:
-                    errors[inp.input_index] = []
-                errors[inp.input_index].append(str(e))
-            except Exception as e:
-                # Catch any other validation errors
-                if inp.input_index not in errors:
-                    errors[inp.input_index] = []
-                errors[inp.input_index].append(f"Validation error: {str(e)}")
-
-        return errors
+    def _raise_if_inputs_invalid(self) -> None:
+        """
+        Validate inputs via ``validate_inputs()`` before submission.
+
+        Raises
+        ------
+        ValueError
+            Listing each invalid input as ``[index] label: errors``.
+        """
+        errors = self.validate_inputs()
+        if errors:
+            labels = {inp.input_index: inp.label for inp in self.inputs}
+            error_msgs = [
+                f"[{idx}] {labels.get(idx, '')}: {', '.join(msgs)}"
+                for idx, msgs in errors.items()
+            ]
+            raise ValueError(f"Input validation failed: {'; '.join(error_msgs)}")
 
     def get_input_value(self, index: int) -> IvkField[Any]:
         """
@@ -648,11 +910,7 @@ class WorkflowHandle:
         ...     print(f"Current value: {field.value}")
         >>> field.value = "New value"
         """
-        if index < 0 or index >= len(self.inputs):
-            raise IndexError(
-                f"Input index {index} out of range (0-{len(self.inputs) - 1})"
-            )
-        return self.inputs[index].field
+        return self._input_at(index).field
 
     def set_input_value(self, index: int, value: IvkField[Any]) -> None:
         """
@@ -687,12 +945,7 @@ class WorkflowHandle:
         >>> # Set the new field
         >>> workflow.set_input_value(0, new_field)
         """
-        if index < 0 or index >= len(self.inputs):
-            raise IndexError(
-                f"Input index {index} out of range (0-{len(self.inputs) - 1})"
-            )
-        
-        workflow_input = self.inputs[index]
+        workflow_input = self._input_at(index)
         
         # Validate type consistency - use the field type locking mechanism
         expected_type = workflow_input._field_type
@@ -708,6 +961,60 @@ class WorkflowHandle:
         # Validate the input after setting
         workflow_input.validate_input()
 
+    def _prepare_batch(self, priority: int) -> dict[str, Any]:
+        """
+        Validate inputs and build the ``enqueue_batch`` request body.
+
+        Raises
+        ------
+        ValueError
+            If any input fails validation.
+        """
+        self._raise_if_inputs_invalid()
+        return {
+            "prepend": priority > 0,  # Higher priority items go to front
+            "batch": {
+                "graph": self._convert_to_api_format(),
+                "runs": 1,
+            },
+        }
+
+    def _enqueue_batch(self, queue_id: str, batch_data: dict[str, Any]) -> list[Any]:
+        """
+        POST a prepared batch and record its batch, item and session ids.
+
+        Returns
+        -------
+        list[Any]
+            Queue item ids reported by the server.
+
+        Raises
+        ------
+        RuntimeError
+            If the response lacks a batch id or item ids.
+        """
+        response = self.client._make_request("POST", f"/queue/{queue_id}/enqueue_batch", json=batch_data)
+        result = response.json()
+
+        # Extract batch information
+        batch_info = result.get("batch", {})
+        self.batch_id = batch_info.get("batch_id")
+        item_ids: list[Any] = list(result.get("item_ids") or [])
+
+        if not self.batch_id or not item_ids:
+            raise RuntimeError(f"Invalid submission response: {result}")
+
+        # Store first item ID for tracking
+        self.item_id = item_ids[0]
+
+        # Get session ID from queue item
+        if self.item_id is None:
+            raise RuntimeError("Submission did not return an item id")
+        queue_item = self._get_queue_item_by_id(queue_id, self.item_id)
+        if queue_item:
+            self.session_id = queue_item.get("session_id")
+        return item_ids
+
     def submit_sync(
         self,
         queue_id: str = "default",
@@ -735,31 +1042,11 @@ class WorkflowHandle:
         RuntimeError
             If submission fails.
         """
-        # Validate inputs first
-        validation_errors = self.validate_inputs()
-        if validation_errors:
-            error_msgs = []
-            for idx, errors in validation_errors.items():
-                input_info = self.inputs[idx]
-                error_msgs.append(f"[{idx}] {input_info.label}: {', '.join(errors)}")
-            raise ValueError(f"Input validation failed: {'; '.join(error_msgs)}")
-        
-        # Convert workflow to API format
-        api_graph = self._convert_to_api_format()
-
-        # Prepare batch submission
-        batch_data = {
-            "prepend": priority > 0,  # Higher priority items go to front
-            "batch": {
-                "graph": api_graph,
-                "runs": 1,
-            },
-        }
+        batch_data = self._prepare_batch(priority)
 
         # Optional debug dump
-        if os.environ.get("DEBUG_WORKFLOW"):
+        if _DEBUG_WORKFLOW:
             try:
-                import json
                 with open("batch_data_debug.json", "w", encoding="utf-8") as f:
                     json.dump(batch_data, f, indent=2)
                 print("\n[DEBUG] Batch data saved to batch_data_debug.json")
@@ -767,28 +1054,8 @@ class WorkflowHandle:
                 pass
         
         # Submit to queue
-        url = f"/queue/{queue_id}/enqueue_batch"
         try:
-            response = self.client._make_request("POST", url, json=batch_data)
-            result = response.json()
-
-            # Extract batch information
-            batch_info = result.get("batch", {})
-            self.batch_id = batch_info.get("batch_id")
-            item_ids = result.get("item_ids", [])
-
-            if not self.batch_id or not item_ids:
-                raise RuntimeError(f"Invalid submission response: {result}")
-
-            # Store first item ID for tracking
-            self.item_id = item_ids[0]
-
-            # Get session ID from queue item
-            if self.item_id is None:
-                raise RuntimeError("Submission did not return an item id")
-            queue_item = self._get_queue_item_by_id(queue_id, self.item_id)
-            if queue_item:
-                self.session_id = queue_item.get("session_id")
+            item_ids = self._enqueue_batch(queue_id, batch_data)
 
             return {
                 "batch_id": self.batch_id,
@@ -807,9 +1074,8 @@ class WorkflowHandle:
                     detail_json = {"non_json_response": resp.text[:2000]}
                 # Persist for offline diffing
                 try:
-                    import json as _json  # local alias to satisfy static analyzer
                     with open("tmp/last_failed_submission_detail.json", "w", encoding="utf-8") as fh:
-                        _json.dump({"status_code": resp.status_code, "detail": detail_json}, fh, indent=2)
+                        json.dump({"status_code": resp.status_code, "detail": detail_json}, fh, indent=2)
                 except Exception:
                     pass
                 raise RuntimeError(
@@ -888,52 +1154,13 @@ class WorkflowHandle:
         ... )
         >>> print(f"Submitted: {result['batch_id']}")
         """
-        # Validate inputs first
-        validation_errors = self.validate_inputs()
-        if validation_errors:
-            error_msgs = []
-            for idx, errors in validation_errors.items():
-                input_info = self.inputs[idx]
-                error_msgs.append(f"[{idx}] {input_info.label}: {', '.join(errors)}")
-            raise ValueError(f"Input validation failed: {'; '.join(error_msgs)}")
-        
-        # Convert workflow to API format
-        api_graph = self._convert_to_api_format()
+        batch_data = self._prepare_batch(priority)
 
-        # Prepare batch submission
-        batch_data = {
-            "prepend": priority > 0,
-            "batch": {
-                "graph": api_graph,
-                "runs": 1,
-            },
-        }
-        
         # Submit to queue asynchronously (still uses sync API endpoint)
-        url = f"/queue/{queue_id}/enqueue_batch"
         try:
             # Use sync request for submission (API doesn't have async endpoint)
-            response = self.client._make_request("POST", url, json=batch_data)
-            result = response.json()
-            
-            # Extract batch information
-            batch_info = result.get("batch", {})
-            self.batch_id = batch_info.get("batch_id")
-            item_ids = result.get("item_ids", [])
-            
-            if not self.batch_id or not item_ids:
-                raise RuntimeError(f"Invalid submission response: {result}")
-            
-            # Store first item ID for tracking
-            self.item_id = item_ids[0]
-            
-            # Get session ID from queue item
-            if self.item_id is None:
-                raise RuntimeError("Submission did not return an item id")
-            queue_item = self._get_queue_item_by_id(queue_id, self.item_id)
-            if queue_item:
-                self.session_id = queue_item.get("session_id")
-            
+            item_ids = self._enqueue_batch(queue_id, batch_data)
+
             # Set up Socket.IO event subscriptions if requested
             if subscribe_events and self.session_id:
                 await self._setup_event_subscriptions(
@@ -1062,10 +1289,11 @@ class WorkflowHandle:
         if not self.item_id:
             raise RuntimeError("No job submitted to wait for")
         
-        start_time = time.time()
+        # Monotonic clock: wall-clock adjustments must not shorten or extend the wait
+        deadline = time.monotonic() + timeout
         last_status = None
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             # Get current queue item status
             queue_item = self._get_queue_item_by_id(queue_id, self.item_id)
             
@@ -1321,7 +1549,7 @@ class WorkflowHandle:
         async def handle_status_change(data: dict[str, Any]) -> None:
             if data.get("session_id") == self.session_id:
                 status = data.get("status")
-                if status in ["completed", "failed", "canceled"]:
+                if status in _TERMINAL_QUEUE_STATUSES:
                     await event_queue.put({
                         "event_type": "queue_item_status_changed",
                         **data
@@ -1329,16 +1557,13 @@ class WorkflowHandle:
                     nonlocal is_complete
                     is_complete = True
         
-        # Yield events as they come in
+        # Yield events as they are pushed by the handlers. Terminal handlers
+        # enqueue their event before flagging completion, so awaiting the
+        # queue directly always wakes up for the final event (no timed polling).
         try:
             while not is_complete:
-                try:
-                    # Wait for next event with a short timeout to check completion
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.5)
-                    yield event
-                except asyncio.TimeoutError:
-                    # Check if we should continue waiting
-                    continue
+                event = await event_queue.get()
+                yield event
             
             # Drain any remaining events
             while not event_queue.empty():
@@ -1428,19 +1653,26 @@ class WorkflowHandle:
     def _convert_to_api_format(self) -> dict[str, Any]:
         """
         Convert workflow definition to API graph format.
-        
-        Uses the original workflow JSON and JSONPath expressions to efficiently 
-        update only the fields that have been set through the WorkflowHandle inputs.
-        
+
+        The workflow topology is fixed for the lifetime of the handle; only
+        the values of GUI-public (form-surfaced) fields change between
+        submissions. The API payload for every node that carries no form
+        input, and the converted edge list, are therefore converted once per
+        definition revision (see ``_build_api_graph_plan``). Each call
+        deep-copies those cached payloads, so the returned graph is owned by
+        the caller, and re-serializes the nodes referenced by ``self.inputs``.
+
+        Code that edits ``definition.raw_data`` (or ``definition.nodes``) in
+        place after a submission must call ``definition.mark_changed()``;
+        otherwise edits to nodes without form inputs do not reach the next
+        payload. ``sync_dnn_model`` does this itself. The plan is also rebuilt
+        when ``INVOKEAI_PRUNE_CONNECTED_FIELDS`` changes.
+
         Returns
         -------
         dict[str, Any]
             API-formatted graph structure.
         """
-        import copy
-        
-        # Start with a deep copy of the original workflow JSON
-        workflow_copy = copy.deepcopy(self.definition.raw_data)
 
     # (Model synchronization now handled explicitly by sync_dnn_model();
     # no automatic silent replacement is performed here.)
@@ -1449,41 +1681,70 @@ class WorkflowHandle:
     # board_id parameter. This was removed to surface misconfigurations early –
     # users must explicitly set board inputs exposed in the form, or rely on the
     # original workflow JSON defaults. No silent fallback is applied here.
-        
-    # Update GUI-public (form-surfaced) fields using JSONPath expressions
-        for inp in self.inputs:
-            # Parse the stored JSONPath expression
-            # Legacy JSONPath update replaced by direct mutation via field metadata
-            field = inp.field
-            api_format = field.to_api_format()
-            node_id = inp.node_id
-            field_name = inp.field_name
-
-            # Skip mutation if destination field is edge-connected (avoid overriding dynamic input)
-            try:
-                if self._root is not None and is_field_connected(self._root, node_id, field_name):  # type: ignore[attr-defined]
-                    continue
-            except Exception:
-                pass
 
-            for node in workflow_copy.get("nodes", []):
-                if node.get("id") != node_id:
-                    continue
-                inputs = (node.get("data", {}).get("inputs") or {})
-                field_dict = inputs.get(field_name)
-                if isinstance(field_dict, dict):
-                    # Generic model identifier handling: nested 'value' dict containing a 'key'
-                    if 'value' in field_dict and isinstance(field_dict['value'], dict) and 'key' in field_dict['value'] and 'key' in api_format:
-                        field_dict['value'] = api_format
-                    # Specific legacy field names for model identifiers stored directly
-                    elif 'value' in field_dict and field_name in ['model', 'vae', 'unet', 'clip']:
-                        field_dict['value'] = api_format
-                    else:
-                        field_dict.update(api_format)
-                else:
-                    inputs[field_name] = api_format
-                break
-        
+        prune_connected = os.environ.get("INVOKEAI_PRUNE_CONNECTED_FIELDS") == "1"
+        plan_key = (prune_connected, self.definition.revision)
+        plan = self._api_graph_plan
+        if plan is None or plan[0] != plan_key:
+            plan = self._api_graph_plan = self._build_api_graph_plan(prune_connected)
+        _, node_slots, connected_fields, edge_endpoints = plan
+
+        api_nodes: dict[str, Any] = {}
+        for node_id, static_api_node, raw_node, node_form_inputs in node_slots:
+            if raw_node is None:
+                api_nodes[node_id] = copy.deepcopy(static_api_node)
+                continue
+
+            # Update GUI-public (form-surfaced) fields on a private copy of the node
+            node = copy.deepcopy(raw_node)
+            for inp in node_form_inputs:
+                self._apply_input_to_node(node, inp)
+            api_node = self._node_to_api_format(node, connected_fields, prune_connected)
+            if api_node is not None:
+                api_nodes[node_id] = api_node
+
+        # Convert edges to API format
+        api_edges = [
+            {
+                "source": {"node_id": source, "field": source_handle},
+                "destination": {"node_id": target, "field": target_handle},
+            }
+            for source, source_handle, target, target_handle in edge_endpoints
+        ]
+
+        return {
+            "id": "workflow",  # Default workflow ID
+            "nodes": api_nodes,
+            "edges": api_edges
+        }
+
+    def _build_api_graph_plan(
+        self, prune_connected: bool
+    ) -> tuple[tuple[bool, int], list[tuple[str, Any, Any, tuple[IvkWorkflowInput, ...]]], set[str], list[tuple[Any, Any, Any, Any]]]:
+        """
+        Precompute the input-independent parts of the API graph.
+
+        Parameters
+        ----------
+        prune_connected : bool
+            Whether edge-connected fields are dropped from node payloads
+            (``INVOKEAI_PRUNE_CONNECTED_FIELDS=1``).
+
+        Returns
+        -------
+        tuple
+            ``(plan_key, node_slots, connected_fields, edge_endpoints)`` where
+            ``plan_key`` is ``(prune_connected, definition.revision)``.
+            ``node_slots`` keeps workflow node order; each slot is
+            ``(node_id, api_node, None, ())`` for nodes without form inputs or
+            ``(node_id, None, raw_node, node_inputs)`` for the first node
+            carrying a given input node id, which is serialized per
+            submission. ``node_inputs`` lists the form inputs written into
+            that node, in form order, excluding edge-connected fields.
+        """
+        raw_data = self.definition.raw_data
+        edges = raw_data.get("edges", [])
+
         # Build a set of fields that are connected via edges.
         # Historically we attempted to REMOVE these fields from the serialized
         # API graph under the assumption that an edge-supplied value should not
@@ -1496,96 +1757,125 @@ class WorkflowHandle:
         # all fields (connected or not) when building the node payload. An env
         # var can restore the pruning behaviour for experiments.
         connected_fields: set[str] = set()
-        for edge in workflow_copy.get("edges", []):
+        for edge in edges:
             target_node = edge.get("target")
             target_field = edge.get("targetHandle")
             if target_node and target_field:
                 connected_fields.add(f"{target_node}.{target_field}")
-        prune_connected = os.environ.get("INVOKEAI_PRUNE_CONNECTED_FIELDS") == "1"
-        
-        # Convert nodes to API format
-        api_nodes = {}
-        for node in workflow_copy.get("nodes", []):
+
+        # Reverse index node_id -> form inputs targeting it. Inputs whose
+        # destination is edge-connected are dropped here once instead of being
+        # checked against every edge on each submission.
+        inputs_by_node: dict[str, list[IvkWorkflowInput]] = {}
+        for inp in self.inputs:
+            node_inputs = inputs_by_node.setdefault(inp.node_id, [])
+            if self._root is not None and f"{inp.node_id}.{inp.field_name}" in connected_fields:
+                continue
+            node_inputs.append(inp)
+
+        node_slots: list[tuple[str, Any, Any, tuple[IvkWorkflowInput, ...]]] = []
+        for node in raw_data.get("nodes", []):
             node_id = node.get("id")
             if not node_id:
                 continue  # Skip nodes without ID
-            
-            node_data = node.get("data", {})
-            node_type = node_data.get("type")
+            form_inputs: list[IvkWorkflowInput] | None = inputs_by_node.pop(node_id, None)
+            if form_inputs is not None:
+                # Inputs only ever update the first node with a matching id
+                node_slots.append((node_id, None, node, tuple(form_inputs)))
+                continue
+            api_node = self._node_to_api_format(node, connected_fields, prune_connected)
+            if api_node is not None:
+                node_slots.append((node_id, api_node, None, ()))
+
+        edge_endpoints = [
+            (edge.get("source"), edge.get("sourceHandle"), edge.get("target"), edge.get("targetHandle"))
+            for edge in edges
+        ]
+        plan_key = (prune_connected, self.definition.revision)
+        return plan_key, node_slots, connected_fields, edge_endpoints
+
+    def _apply_input_to_node(self, node: dict[str, Any], inp: IvkWorkflowInput) -> None:
+        """Write the API value of a form input into (a copy of) its workflow node."""
+        # Legacy JSONPath update replaced by direct mutation via field metadata
+        # (Edge-connected destinations are filtered out by _build_api_graph_plan
+        # so a dynamic input is never overridden.)
+        api_format = inp.field.to_api_format()
+        field_name = inp.field_name
+
+        inputs = (node.get("data", {}).get("inputs") or {})
+        field_dict = inputs.get(field_name)
+        if isinstance(field_dict, dict):
+            # Generic model identifier handling: nested 'value' dict containing a 'key'
+            if 'value' in field_dict and isinstance(field_dict['value'], dict) and 'key' in field_dict['value'] and 'key' in api_format:
+                field_dict['value'] = api_format
+            # Specific legacy field names for model identifiers stored directly
+            elif 'value' in field_dict and field_name in ['model', 'vae', 'unet', 'clip']:
+                field_dict['value'] = api_format
+            else:
+                field_dict.update(api_format)
+        else:
+            inputs[field_name] = api_format
+
+    @staticmethod
+    def _node_to_api_format(
+        node: dict[str, Any], connected_fields: set[str], prune_connected: bool
+    ) -> dict[str, Any] | None:
+        """Convert one workflow node to its API graph payload (None for GUI-only nodes)."""
+        node_id = node.get("id")
+        node_data = node.get("data", {})
+        node_type = node_data.get("type")
+
+        # Skip non-executable/GUI-only helper nodes that the server schema doesn't accept
+        if node_type in {"notes"}:
+            return None
 
-            # Skip non-executable/GUI-only helper nodes that the server schema doesn't accept
-            if node_type in {"notes"}:
+        # Create API node with basic fields
+        api_node = {
+            "id": node_id,
+            "type": node_type,
+            "is_intermediate": node_data.get("isIntermediate", True),
+            "use_cache": node_data.get("useCache", True)
+        }
+
+        # Process inputs - only include fields with values
+        node_inputs = node_data.get("inputs", {})
+        for field_name, field_data in node_inputs.items():
+            # Optionally skip connected fields only if pruning explicitly enabled
+            if prune_connected and f"{node_id}.{field_name}" in connected_fields:
                 continue
-            
-            # Create API node with basic fields
-            api_node = {
-                "id": node_id,
-                "type": node_type,
-                "is_intermediate": node_data.get("isIntermediate", True),
-                "use_cache": node_data.get("useCache", True)
-            }
-            
-            # Process inputs - only include fields with values
-            # (Note: JSONPath-based mutation above already updated GUI-public fields in workflow_copy)
-            node_inputs = node_data.get("inputs", {})
-            for field_name, field_data in node_inputs.items():
-                # Optionally skip connected fields only if pruning explicitly enabled
-                if prune_connected and f"{node_id}.{field_name}" in connected_fields:
-                    continue
-                
-                # Get the value from the updated workflow_copy
-                field_value = None
-                if isinstance(field_data, dict):
-                    if "value" in field_data:
-                        # Standard fields have a "value" key
-                        field_value = field_data["value"]
-                    elif field_name == "model" and "key" in field_data:
-                        # Model fields don't have a "value" key, they ARE the value
-                        # (contains key, hash, name, base, type directly)
-                        field_value = field_data
-                    elif "key" in field_data and "type" in field_data:
-                        # Other model-like fields (VAE, LoRA, etc.)
-                        field_value = field_data
-                else:
-                    # Sometimes the field_data is the value itself (primitives)
+
+            # Get the value from the (possibly updated) node copy
+            field_value = None
+            if isinstance(field_data, dict):
+                if "value" in field_data:
+                    # Standard fields have a "value" key
+                    field_value = field_data["value"]
+                elif field_name == "model" and "key" in field_data:
+                    # Model fields don't have a "value" key, they ARE the value
+                    # (contains key, hash, name, base, type directly)
                     field_value = field_data
-                
-                # Only include the field if it has a non-None value
-                if field_value is not None:
-                    # Normalize image field shape: server expects {'image_name': <filename>} for image inputs
-                    if field_name == 'image' and isinstance(field_value, str):
-                        field_value = {'image_name': field_value}
-                    api_node[field_name] = field_value
-            
-            # Normalize board field if present and still a raw string like 'auto'
-            if "board" in api_node and isinstance(api_node["board"], str):
-                existing = api_node["board"]
-                if existing == "auto":
-                    existing = "none"  # explicit default sentinel
-                api_node["board"] = {"board_id": existing}
-            
-            api_nodes[node_id] = api_node
-        
-        # Convert edges to API format
-        api_edges = []
-        for edge in workflow_copy.get("edges", []):
-            api_edge = {
-                "source": {
-                    "node_id": edge.get("source"),
-                    "field": edge.get("sourceHandle")
-                },
-                "destination": {
-                    "node_id": edge.get("target"),
-                    "field": edge.get("targetHandle")
-                }
-            }
-            api_edges.append(api_edge)
-        
-        return {
-            "id": "workflow",  # Default workflow ID
-            "nodes": api_nodes,
-            "edges": api_edges
-        }
+                elif "key" in field_data and "type" in field_data:
+                    # Other model-like fields (VAE, LoRA, etc.)
+                    field_value = field_data
+            else:
+                # Sometimes the field_data is the value itself (primitives)
+                field_value = field_data
+
+            # Only include the field if it has a non-None value
+            if field_value is not None:
+                # Normalize image field shape: server expects {'image_name': <filename>} for image inputs
+                if field_name == 'image' and isinstance(field_value, str):
+                    field_value = {'image_name': field_value}
+                api_node[field_name] = field_value
+
+        # Normalize board field if present and still a raw string like 'auto'
+        if "board" in api_node and isinstance(api_node["board"], str):
+            existing = api_node["board"]
+            if existing == "auto":
+                existing = "none"  # explicit default sentinel
+            api_node["board"] = {"board_id": existing}
+
+        return api_node
 
     # ------------------------------------------------------------------
     # DNN Model Synchronization
@@ -1681,49 +1971,48 @@ class WorkflowHandle:
                         field_data.update(new_dict)
                     replacements.append((old_field, new_field))
 
-        # Sync parsed root model if present
-        if getattr(self, '_root', None) is not None:
+        # Node payloads changed; cached API graphs (of every handle sharing
+        # this definition) are rebuilt on next submit. The parsed root is shared
+        # and read-only, so take the re-parsed one instead of editing it.
+        if replacements:
+            self.definition.mark_changed()
             try:
-                id_map = {n.get('id'): n for n in nodes if isinstance(n, dict)}
-                for rn in self._root.nodes:  # type: ignore[attr-defined]
-                    try:
-                        rid = rn.get('id')
-                        if rid in id_map:
-                            updated = id_map[rid]
-                            rn.clear()
-                            rn.update(updated)  # type: ignore[union-attr]
-                    except Exception:
-                        continue
+                self._root = self.definition.get_workflow_root()
             except Exception:
-                pass
+                self._root = None  # type: ignore[assignment]
+
+        # Raw nodes by id (first occurrence wins, matching the former linear scans)
+        id_map: dict[Any, dict[str, Any]] = {}
+        for n in nodes:
+            if isinstance(n, dict):
+                id_map.setdefault(n.get('id'), n)
 
         # Refresh IvkModelIdentifierField input objects
         from invokeai_py_client.ivk_fields.models import IvkModelIdentifierField as _IMF
         for inp in self.inputs:
             fld = inp.field
             if isinstance(fld, _IMF):
-                for node in nodes:
-                    if node.get('id') != inp.node_id:  # type: ignore[union-attr]
-                        continue
-                    nd = node.get('data', {})
-                    inps = nd.get('inputs', {})
-                    fd = inps.get(inp.field_name)
-                    model_ref = None
-                    if isinstance(fd, dict):
-                        if 'value' in fd and isinstance(fd['value'], dict) and 'key' in fd['value']:
-                            model_ref = fd['value']
-                        elif 'key' in fd:
-                            model_ref = fd
-                    if model_ref:
-                        try:
-                            fld.key = model_ref.get('key', fld.key)
-                            fld.hash = model_ref.get('hash', fld.hash)
-                            fld.name = model_ref.get('name', fld.name)
-                            fld.base = model_ref.get('base', fld.base)
-                            fld.type = model_ref.get('type', fld.type)
-                        except Exception:
-                            pass
-                    break
+                node = id_map.get(inp.node_id)
+                if node is None:
+                    continue
+                nd = node.get('data', {})
+                inps = nd.get('inputs', {})
+                fd = inps.get(inp.field_name)
+                model_ref = None
+                if isinstance(fd, dict):
+                    if 'value' in fd and isinstance(fd['value'], dict) and 'key' in fd['value']:
+                        model_ref = fd['value']
+                    elif 'key' in fd:
+                        model_ref = fd
+                if model_ref:
+                    try:
+                        fld.key = model_ref.get('key', fld.key)
+                        fld.hash = model_ref.get('hash', fld.hash)
+                        fld.name = model_ref.get('name', fld.name)
+                        fld.base = model_ref.get('base', fld.base)
+                        fld.type = model_ref.get('type', fld.type)
+                    except Exception:
+                        pass
 
         return replacements
     
@@ -1801,26 +2090,23 @@ class WorkflowHandle:
                 continue
         
         # Tier 1: Collect images from results (prepared -> original)
-        results_images: dict[str, list[str]] = {}
+        # (insertion-ordered dicts act as ordered sets of image names)
+        results_images: dict[str, dict[str, None]] = {}
         for prepared_id, payload in session_results.items():
             original_id = prepared_source_mapping.get(prepared_id, prepared_id)
             img_obj = (payload or {}).get('image') or {}
             name = img_obj.get('image_name')
             if name:
-                results_images.setdefault(original_id, [])
-                if name not in results_images[original_id]:
-                    results_images[original_id].append(name)
+                results_images.setdefault(original_id, {})[name] = None
         
         # Tier 2: Legacy outputs array fallback
-        legacy_images: dict[str, list[str]] = {}
+        legacy_images: dict[str, dict[str, None]] = {}
         for out in queue_item.get('outputs', []) or []:
             node_id = out.get('node_id') or out.get('id')
             img_obj = out.get('image') or {}
             name = img_obj.get('image_name')
             if node_id and name:
-                legacy_images.setdefault(node_id, [])
-                if name not in legacy_images[node_id]:
-                    legacy_images[node_id].append(name)
+                legacy_images.setdefault(node_id, {})[name] = None
         
         # Tier 3: Descendant traversal helper
         def descend_collect(start_id: str) -> list[str]:
@@ -1853,11 +2139,11 @@ class WorkflowHandle:
             board_id = board_entry.get('board_id') or 'none'
 
             # Collect images using tiered approach
-            images = list(results_images.get(node_id, []))
+            images = list(results_images.get(node_id, ()))
             tier = 'results' if images else ''
 
             if not images:
-                images = list(legacy_images.get(node_id, []))
+                images = list(legacy_images.get(node_id, ()))
                 tier = 'legacy' if images else tier
 
             if not images:
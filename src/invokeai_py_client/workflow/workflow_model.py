@@ -8,10 +8,29 @@ loaded from a JSON file exported from the InvokeAI GUI.
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from invokeai_py_client.workflow.upstream_models import WorkflowRoot, load_workflow_json
+
+try:  # Optional faster parser (``pip install invokeai-py-client[speedups]``)
+    import orjson
+
+    def _load_json_file(path: Path) -> Any:
+        """Parse a JSON file with orjson, straight from bytes (no text decode step)."""
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(path.read_bytes())
+
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    def _load_json_file(path: Path) -> Any:
+        """Parse a JSON file with the stdlib ``json`` module."""
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
 
 
 class WorkflowDefinition(BaseModel):
@@ -92,6 +111,16 @@ class WorkflowDefinition(BaseModel):
     # Store the complete raw data for access to any additional fields
     raw_data: dict[str, Any] = Field(default_factory=dict, exclude=True)
 
+    # Derived state shared by every WorkflowHandle created from this definition
+    _revision: int = PrivateAttr(default=0)
+    _workflow_root: tuple[int, WorkflowRoot] | None = PrivateAttr(default=None)
+    # (revision, field registry version, specs) written by WorkflowHandle: the
+    # form traversal result plus prototype fields that new handles copy
+    _input_template: tuple[int, Any, tuple[Any, ...]] | None = PrivateAttr(default=None)
+    # (revision, index) snapshot backing ``nodes_by_id``; kept as a plain
+    # dict so the definition stays deep-copyable and picklable
+    _nodes_by_id: tuple[int, dict[Any, dict[str, Any]]] | None = PrivateAttr(default=None)
+
     @property
     def version(self) -> str:
         """Get the workflow schema version from meta.version."""
@@ -103,6 +132,25 @@ class WorkflowDefinition(BaseModel):
         """Get the number of nodes in the workflow."""
         return len(self.nodes)
 
+    @property
+    def nodes_by_id(self) -> Mapping[Any, dict[str, Any]]:
+        """
+        Read-only ``node id -> node`` index over ``nodes``.
+
+        Built once per ``revision`` and shared by every handle created from
+        this definition. It is not refreshed by in-place edits: after
+        replacing, adding or removing entries of ``nodes``, call
+        ``mark_changed()``. For duplicate ids the first node wins.
+        ``get_node_by_id`` always scans the live list instead.
+        """
+        cached = self._nodes_by_id
+        if cached is None or cached[0] != self._revision:
+            index: dict[Any, dict[str, Any]] = {}
+            for node in self.nodes:
+                index.setdefault(node.get("id"), node)
+            cached = self._nodes_by_id = (self._revision, index)
+        return MappingProxyType(cached[1])
+
     @property
     def edge_count(self) -> int:
         """Get the number of edges (connections) in the workflow."""
@@ -113,6 +161,45 @@ class WorkflowDefinition(BaseModel):
         """Get the number of exposed configurable fields."""
         return len(self.exposedFields)
 
+    @property
+    def revision(self) -> int:
+        """Change counter bumped by ``mark_changed()``; derived caches compare against it."""
+        return self._revision
+
+    def mark_changed(self) -> None:
+        """
+        Signal that ``raw_data`` was modified in place.
+
+        The parsed upstream model and the per-handle submission caches are
+        rebuilt on next use. ``WorkflowHandle.sync_dnn_model`` calls this
+        after rewriting model references.
+        """
+        self._revision += 1
+
+    def get_workflow_root(self) -> WorkflowRoot:
+        """
+        Get the upstream ``WorkflowRoot`` model of this definition.
+
+        The raw JSON is parsed once per revision and the resulting model is
+        shared by all handles created from this definition, so it should be
+        treated as read-only.
+
+        Returns
+        -------
+        WorkflowRoot
+            The parsed workflow.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If the raw data does not match the upstream workflow schema.
+        """
+        cached = self._workflow_root
+        if cached is None or cached[0] != self._revision:
+            root = load_workflow_json(self.to_readonly_dict())
+            cached = self._workflow_root = (self._revision, root)
+        return cached[1]
+
     @classmethod
     def from_file(cls, filepath: Path | str) -> WorkflowDefinition:
         """
@@ -147,8 +234,7 @@ class WorkflowDefinition(BaseModel):
             raise FileNotFoundError(f"Workflow file not found: {filepath}")
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json_file(filepath)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in workflow file: {e}") from e
 
@@ -210,6 +296,24 @@ class WorkflowDefinition(BaseModel):
         # Reconstruct from fields if raw_data not available
         return self.model_dump(exclude={"raw_data"}, by_alias=True)
 
+    def to_readonly_dict(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of the workflow dictionary without copying it.
+
+        Use this instead of ``to_dict()`` when the data is only inspected.
+
+        Returns
+        -------
+        Mapping[str, Any]
+            A ``MappingProxyType`` over the original raw data, or over a
+            dictionary reconstructed from the model fields if no raw data is
+            available. Nested values are shared with the definition and
+            must not be modified.
+        """
+        if self.raw_data:
+            return MappingProxyType(self.raw_data)
+        return MappingProxyType(self.to_dict())
+
     def to_json(self, indent: int = 2) -> str:
         """
         Convert the workflow definition to a JSON string.
@@ -16,8 +16,15 @@ import pytest
 
 from invokeai_py_client.workflow.upstream_models import (
     load_workflow_json,
+    load_workflow_json_bytes,
+    dump_workflow_json,
+    workflow_to_dict,
     enumerate_output_nodes,
     iter_form_input_fields,
+    build_input_jsonpath_parsed,
+    resolve_input_field,
+    update_node_input_value,
+    index_nodes,
 )
 
 WORKFLOW_PATH = Path(__file__).parent.parent / "data" / "workflows" / "sdxl-text-to-image.json"
@@ -39,6 +46,20 @@ def test_workflow_load_basic_metadata():
     assert len(root.edges) == len(raw.get("edges", []))
 
 
+def test_load_workflow_json_bytes_matches_dict_loader():
+    raw = _load_raw()
+    from_bytes = load_workflow_json_bytes(WORKFLOW_PATH.read_bytes())
+    assert from_bytes.model_dump() == load_workflow_json(raw).model_dump()
+
+
+def test_dump_workflow_json_roundtrips_through_bytes_loader():
+    root = load_workflow_json(_load_raw())
+    dumped = dump_workflow_json(root)
+    assert isinstance(dumped, bytes)
+    assert json.loads(dumped) == workflow_to_dict(root)
+    assert load_workflow_json_bytes(dumped).model_dump(exclude_none=True) == workflow_to_dict(root)
+
+
 def test_nodes_preserve_ids_and_order():
     raw = _load_raw()
     root = load_workflow_json(raw)
@@ -79,6 +100,83 @@ def test_iter_form_input_fields_matches_positive_prompt_field():
     assert matches, "iter_form_input_fields did not return expected positive prompt value field"
 
 
+def test_iter_form_input_fields_accepts_prebuilt_node_index():
+    raw = _load_raw()
+    root = load_workflow_json(raw)
+    index = index_nodes(root)
+    assert len(index) == len(raw["nodes"])
+    assert list(iter_form_input_fields(root, index)) == list(iter_form_input_fields(root))
+
+
+def test_build_input_jsonpath_parsed_is_cached_and_resolves_field():
+    raw = _load_raw()
+    node = next(n for n in raw["nodes"] if n["id"].startswith("positive_prompt:"))
+    expr = build_input_jsonpath_parsed(node["id"], "value")
+    assert expr is build_input_jsonpath_parsed(node["id"], "value")
+    matches = expr.find(raw)
+    assert [m.value for m in matches] == [node["data"]["inputs"]["value"]]
+
+
+def test_resolve_input_field_matches_jsonpath_and_update():
+    raw = _load_raw()
+    root = load_workflow_json(raw)
+    node = next(n for n in root.nodes if n["id"].startswith("positive_prompt:"))
+    field = resolve_input_field(root, node["id"], "value")
+    assert field is node["data"]["inputs"]["value"]
+    assert [m.value for m in build_input_jsonpath_parsed(node["id"], "value").find(root.model_dump())] == [field]
+    assert resolve_input_field(root, "missing-node", "value") is None
+    assert update_node_input_value(root, node["id"], "value", "a red fox", index_nodes(root))
+    assert field["value"] == "a red fox"
+    assert not update_node_input_value(root, node["id"], "no_such_field", "x")
+
+
+def test_get_typed_node_validates_matching_node_only():
+    raw = _load_raw()
+    root = load_workflow_json(raw)
+    target = raw["nodes"][-1]
+    typed = root.get_typed_node(target["id"])
+    assert typed is not None and typed.id == target["id"]
+    assert typed.data.type == target["data"]["type"]
+    assert root.get_typed_node("missing-node") is None
+    assert [n.id for n in root.iter_typed_nodes()] == [n["id"] for n in raw["nodes"]]
+
+
+def test_node_field_elements_filters_and_tracks_element_changes():
+    raw = _load_raw()
+    root = load_workflow_json(raw)
+    expected = [
+        eid for eid, e in raw["form"]["elements"].items()
+        if e["type"] == "node-field" and e["data"].get("fieldIdentifier")
+    ]
+    assert [e.id for e in root.form.node_field_elements] == expected
+    # Removing an element is reflected on the next access
+    del root.form.elements[expected[0]]
+    assert [e.id for e in root.form.node_field_elements] == expected[1:]
+
+
+def test_form_helpers_see_replaced_and_edited_elements():
+    raw = _load_raw()
+    root = load_workflow_json(raw)
+    l2i = next(n for n in raw["nodes"] if n["data"]["type"] == "l2i")
+    board_elem = next(
+        e for e in root.form.node_field_elements
+        if e.data.fieldIdentifier and e.data.fieldIdentifier["fieldName"] == "board"
+    )
+    assert (l2i["id"], "l2i", True) in list(enumerate_output_nodes(root))
+
+    # In-place fieldIdentifier edit: the board is no longer exposed
+    board_elem.data.fieldIdentifier = {"nodeId": l2i["id"], "fieldName": "fp32"}
+    assert (l2i["id"], "l2i", False) in list(enumerate_output_nodes(root))
+    fields = {(nid, fname) for nid, fname, _eid, _f in iter_form_input_fields(root)}
+    assert (l2i["id"], "fp32") in fields and (l2i["id"], "board") not in fields
+
+    # Replacing the element under the same key is seen as well
+    replacement = board_elem.model_copy(deep=True)
+    replacement.data.fieldIdentifier = {"nodeId": l2i["id"], "fieldName": "board"}
+    root.form.elements[board_elem.id] = replacement
+    assert (l2i["id"], "l2i", True) in list(enumerate_output_nodes(root))
+
+
 def test_roundtrip_serialization_structure_parity():
     raw = _load_raw()
     root = load_workflow_json(raw)
@@ -0,0 +1,329 @@
+"""Offline tests for ``WorkflowHandle`` / ``WorkflowDefinition`` caching and input access.
+
+Exercise behaviour that needs no running InvokeAI server, using the
+example workflows in ``data/workflows``:
+  * Cached API graph plan and its invalidation via ``mark_changed()``.
+  * Submission-time validation going through ``validate_inputs()``; enqueue
+    response handling shared by ``submit_sync`` and ``submit``.
+  * Copying and pickling of ``IvkWorkflowInput``, handles and definitions;
+    weak references.
+  * Per-definition input template shared by handles.
+  * Input lookups by label / node field and non-raising validation.
+  * Shared ``get_workflow_root`` and ``to_readonly_dict`` views.
+  * Live ``get_node_by_id`` versus the revision-keyed ``nodes_by_id`` index.
+"""
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import weakref
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from invokeai_py_client.ivk_fields import IvkIntegerField, IvkStringField
+from invokeai_py_client.workflow import field_plugins
+from invokeai_py_client.workflow.workflow_handle import IvkWorkflowInput, WorkflowHandle
+from invokeai_py_client.workflow.workflow_model import WorkflowDefinition
+
+WORKFLOWS_DIR = Path(__file__).parent.parent / "data" / "workflows"
+SDXL_T2I = WORKFLOWS_DIR / "sdxl-text-to-image.json"
+SDXL_FLUX_REFINE = WORKFLOWS_DIR / "sdxl-flux-refine.json"
+
+MODEL_NODE = "sdxl_model_loader:PwBr7RXRsy"
+RAND_NODE = "fe37ca02-b720-41f8-a10c-5ab7f110e336"  # carries no form input
+
+
+def _load_raw(path: Path = SDXL_T2I) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _raw_node(definition: WorkflowDefinition, node_id: str) -> dict[str, Any]:
+    return next(n for n in definition.raw_data["nodes"] if n["id"] == node_id)
+
+
+def test_static_node_edit_reaches_payload_after_mark_changed():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    handle = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    assert handle._convert_to_api_format()["nodes"][RAND_NODE]["high"] == 2147483647
+
+    _raw_node(definition, RAND_NODE)["data"]["inputs"]["high"]["value"] = 1000
+    # Nodes without form inputs are served from the cached plan until signalled
+    assert handle._convert_to_api_format()["nodes"][RAND_NODE]["high"] == 2147483647
+    definition.mark_changed()
+    assert handle._convert_to_api_format()["nodes"][RAND_NODE]["high"] == 1000
+
+
+def test_api_graph_payload_is_not_shared_between_calls():
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    first = handle._convert_to_api_format()
+    first["nodes"][RAND_NODE]["high"] = -1
+    assert handle._convert_to_api_format()["nodes"][RAND_NODE]["high"] == 2147483647
+
+
+def test_sync_dnn_model_rebuilds_cached_payload():
+    raw = _load_raw()
+    # Drop the model field from the form so the loader node is served from the
+    # cached plan rather than re-serialized from an input on every call.
+    elements = raw["form"]["elements"]
+    model_elem = next(
+        k for k, e in elements.items()
+        if e.get("type") == "node-field" and e["data"]["fieldIdentifier"]["nodeId"] == MODEL_NODE
+    )
+    del elements[model_elem]
+    elements["root"]["data"]["children"].remove(model_elem)
+
+    definition = WorkflowDefinition.from_dict(raw)
+    installed = SimpleNamespace(
+        key="new-key", hash="blake3:new", name="juggernautXL_v9Rundiffusionphoto2", base="sdxl", type="main"
+    )
+    client = SimpleNamespace(dnn_model_repo=SimpleNamespace(list_models=lambda: [installed]))
+    handle = WorkflowHandle(client, definition)  # type: ignore[arg-type]
+    assert handle._convert_to_api_format()["nodes"][MODEL_NODE]["model"]["key"] != "new-key"
+
+    other = WorkflowHandle(client, definition)  # type: ignore[arg-type]
+    shared_root = other._root
+    assert shared_root is handle._root
+
+    revision = definition.revision
+    assert handle.sync_dnn_model(by_name=True)
+    assert definition.revision > revision
+    assert handle._convert_to_api_format()["nodes"][MODEL_NODE]["model"]["key"] == "new-key"
+
+    # The shared parsed root is re-parsed for the new revision, not edited
+    # in place; the other handle keeps the object it was given.
+    assert handle._root is definition.get_workflow_root()
+    assert handle._root is not shared_root
+    assert other._root is shared_root
+
+
+def test_prune_connected_fields_toggle_rebuilds_plan(monkeypatch: pytest.MonkeyPatch):
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    monkeypatch.delenv("INVOKEAI_PRUNE_CONNECTED_FIELDS", raising=False)
+    assert "prompt" in handle._convert_to_api_format()["nodes"]["pos_cond:o9T4cKV8xt"]
+
+    monkeypatch.setenv("INVOKEAI_PRUNE_CONNECTED_FIELDS", "1")
+    assert "prompt" not in handle._convert_to_api_format()["nodes"]["pos_cond:o9T4cKV8xt"]
+
+    monkeypatch.delenv("INVOKEAI_PRUNE_CONNECTED_FIELDS")
+    assert "prompt" in handle._convert_to_api_format()["nodes"]["pos_cond:o9T4cKV8xt"]
+
+
+def test_submission_validates_through_validate_inputs():
+    class StrictHandle(WorkflowHandle):
+        __slots__ = ()
+
+        def validate_inputs(self) -> dict[int, list[str]]:
+            return {1: ["rejected by subclass"]}
+
+    handle = StrictHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match=r"\[1\] positive prompt: rejected by subclass"):
+        handle.submit_sync()
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_workflow_input_copies_keep_state_and_type_lock(clone):
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    original = handle.inputs[1]
+    dup = clone(original)
+
+    assert repr(dup) == repr(original)
+    dup.field = IvkStringField(value="other")
+    with pytest.raises(TypeError):
+        dup.field = IvkIntegerField(value=1)
+
+
+def test_workflow_handle_deepcopy_has_independent_fields():
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    dup = copy.deepcopy(handle)
+    dup.get_input_value(1).value = "changed"  # type: ignore[attr-defined]
+    assert handle.get_input_value(1).value == "deep space, high quality, colorful"  # type: ignore[attr-defined]
+
+
+def test_workflow_handle_supports_weak_references():
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    ref = weakref.ref(handle)
+    assert ref() is handle
+
+
+def test_get_node_by_id_sees_replaced_nodes():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    first_id = definition.nodes[0]["id"]
+    assert definition.nodes_by_id[first_id] is definition.nodes[0]
+
+    replacement = {**definition.nodes[0], "label": "replaced"}
+    definition.nodes[0] = replacement
+    assert definition.get_node_by_id(first_id) is replacement
+    # The shared index follows the revision
+    definition.mark_changed()
+    assert definition.nodes_by_id[first_id] is replacement
+
+
+def test_definition_and_handle_copyable_after_node_index_built():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    handle = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    handle.list_outputs()
+    assert definition._nodes_by_id is not None
+
+    for dup_def in (
+        copy.deepcopy(definition),
+        definition.model_copy(deep=True),
+        pickle.loads(pickle.dumps(definition)),
+    ):
+        assert dup_def.nodes_by_id.keys() == definition.nodes_by_id.keys()
+    for dup in (copy.deepcopy(handle), pickle.loads(pickle.dumps(handle))):
+        assert [o.node_id for o in dup.list_outputs()] == [o.node_id for o in handle.list_outputs()]
+
+
+def test_list_inputs_reflects_replaced_inputs():
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    before = handle.list_inputs()
+    swapped = copy.copy(handle.inputs[0])
+    handle.inputs[0] = swapped
+    handle.inputs[1], handle.inputs[2] = handle.inputs[2], handle.inputs[1]
+
+    after = handle.list_inputs()
+    assert len(after) == len(before)
+    assert after[0] is swapped
+    assert after[1:3] == (before[2], before[1])
+
+
+def test_handles_from_one_definition_get_independent_fields():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    first = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    second = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    assert [repr(i) for i in first.inputs] == [repr(i) for i in second.inputs]
+    assert all(a.field is not b.field for a, b in zip(first.inputs, second.inputs, strict=True))
+
+    first.get_input_value(1).value = "changed"  # type: ignore[attr-defined]
+    assert second.get_input_value(1).value == "deep space, high quality, colorful"  # type: ignore[attr-defined]
+    assert WorkflowHandle(None, definition).get_input_value(1).value == "deep space, high quality, colorful"  # type: ignore[arg-type, attr-defined]
+
+
+def test_input_template_rebuilt_after_mark_changed():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    _raw_node(definition, "positive_prompt:kjUMdcg0zO")["data"]["inputs"]["value"]["value"] = "edited"
+
+    # Documented contract: in-place edits need mark_changed() to reach new handles
+    stale = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    assert stale.get_input_value(1).value == "deep space, high quality, colorful"  # type: ignore[attr-defined]
+    definition.mark_changed()
+    fresh = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    assert fresh.get_input_value(1).value == "edited"  # type: ignore[attr-defined]
+
+
+def test_input_template_rebuilt_after_registry_change():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    template = definition._input_template
+    WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    assert definition._input_template is template
+
+    field_plugins.reset_field_plugin_manager()
+    handle = WorkflowHandle(None, definition)  # type: ignore[arg-type]
+    assert definition._input_template is not template
+    assert [repr(i) for i in handle.inputs] == [repr(i) for i in WorkflowHandle(None, definition).inputs]  # type: ignore[arg-type]
+
+
+def test_get_input_by_label_and_field():
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    prompt = handle.get_input_by_label("positive prompt")
+    assert prompt is handle.inputs[1]
+    assert handle.get_input_by_field("positive_prompt:kjUMdcg0zO", "value") is prompt
+
+    with pytest.raises(KeyError):
+        handle.get_input_by_label("no such label")
+    with pytest.raises(KeyError):
+        handle.get_input_by_field("positive_prompt:kjUMdcg0zO", "no_such_field")
+
+
+def test_get_input_by_label_rejects_duplicate_labels():
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_FLUX_REFINE))  # type: ignore[arg-type]
+    boards = [inp for inp in handle.inputs if inp.label == "Output Board"]
+    assert len(boards) > 1
+    with pytest.raises(ValueError, match="Output Board"):
+        handle.get_input_by_label("Output Board")
+    # Each duplicate stays reachable through its node field
+    for inp in boards:
+        assert handle.get_input_by_field(inp.node_id, inp.field_name) is inp
+
+
+def _make_input(field: Any, *, required: bool) -> IvkWorkflowInput:
+    return IvkWorkflowInput(
+        label="Prompt", node_name="n", node_id="n1", field_name="value",
+        field=field, required=required, input_index=0, jsonpath="$",
+    )
+
+
+def test_validate_input_errors_returns_messages_without_raising():
+    class RejectingStringField(IvkStringField):
+        def validate_field(self) -> bool:
+            raise ValueError("too short")
+
+    assert _make_input(IvkStringField(value="ok"), required=True).validate_input_errors() == []
+    missing = _make_input(IvkStringField(value=None), required=True)
+    assert missing.is_value_field  # a value-style field, even while unset
+    assert missing.validate_input_errors() == ["Required field 'Prompt' is not set"]
+    with pytest.raises(ValueError, match="is not set"):
+        missing.validate_input()
+    assert _make_input(RejectingStringField(value="x"), required=False).validate_input_errors() == ["too short"]
+
+    handle = WorkflowHandle(None, WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+    assert handle.validate_inputs() == {}
+
+
+def test_get_workflow_root_is_shared_per_revision():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    root = definition.get_workflow_root()
+    assert definition.get_workflow_root() is root
+    assert [n["id"] for n in root.nodes] == [n["id"] for n in definition.raw_data["nodes"]]
+    definition.mark_changed()
+    assert definition.get_workflow_root() is not root
+
+
+def test_to_readonly_dict_is_an_uncopied_view():
+    definition = WorkflowDefinition.from_file(SDXL_T2I)
+    view = definition.to_readonly_dict()
+    assert view == definition.to_dict()
+    assert view["nodes"] is definition.raw_data["nodes"]
+    with pytest.raises(TypeError):
+        view["name"] = "renamed"  # type: ignore[index]
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+
+def test_submit_sync_and_submit_share_enqueue_handling(monkeypatch: pytest.MonkeyPatch):
+    import asyncio
+
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def make_request(method: str, url: str, json: dict[str, Any]) -> _FakeResponse:
+        calls.append((method, url, json))
+        return _FakeResponse({"batch": {"batch_id": "b1"}, "item_ids": (7, 8)})
+
+    monkeypatch.setattr(WorkflowHandle, "_get_queue_item_by_id", lambda self, q, i: {"session_id": "s1"})
+    handle = WorkflowHandle(SimpleNamespace(_make_request=make_request), WorkflowDefinition.from_file(SDXL_T2I))  # type: ignore[arg-type]
+
+    expected = {"batch_id": "b1", "item_ids": [7, 8], "enqueued": 2, "session_id": "s1"}
+    assert handle.submit_sync(queue_id="q1", priority=1) == expected
+    assert asyncio.run(handle.submit(queue_id="q2")) == expected
+    assert [(m, u, body["prepend"]) for m, u, body in calls] == [
+        ("POST", "/queue/q1/enqueue_batch", True),
+        ("POST", "/queue/q2/enqueue_batch", False),
+    ]
+    assert (handle.batch_id, handle.item_id, handle.session_id) == ("b1", 7, "s1")